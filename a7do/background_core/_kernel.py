@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
+
+# ============================================================
+# Config Packing
+# ============================================================
+
+# BackgroundConfig fields packed by `config_tuple`, in tuple order.
+# Read them back positionally with the IDX_* constants below.
+CONFIG_FIELDS = (
+    "arousal_min",
+    "arousal_max",
+    "confidence_min",
+    "confidence_max",
+    "uncertainty_min",
+    "uncertainty_max",
+    "curiosity_min",
+    "curiosity_max",
+    "valence_min",
+    "valence_max",
+    "arousal_decay",
+    "uncertainty_decay_on_experience",
+    "curiosity_rise_on_stagnation",
+    "curiosity_decay_on_novelty",
+    "arousal_bump_on_observation",
+    "arousal_bump_on_failure",
+    "confidence_drop_on_failure",
+    "confidence_rise_on_success",
+    "confidence_floor_rise_on_recovery",
+    "confidence_floor_max",
+    "high_arousal_threshold",
+    "low_recovery_threshold",
+    "high_arousal_cycle_limit",
+    "low_recovery_cycle_limit",
+)
+
+(
+    IDX_AROUSAL_MIN,
+    IDX_AROUSAL_MAX,
+    IDX_CONFIDENCE_MIN,
+    IDX_CONFIDENCE_MAX,
+    IDX_UNCERTAINTY_MIN,
+    IDX_UNCERTAINTY_MAX,
+    IDX_CURIOSITY_MIN,
+    IDX_CURIOSITY_MAX,
+    IDX_VALENCE_MIN,
+    IDX_VALENCE_MAX,
+    IDX_AROUSAL_DECAY,
+    IDX_UNCERTAINTY_DECAY_ON_EXPERIENCE,
+    IDX_CURIOSITY_RISE_ON_STAGNATION,
+    IDX_CURIOSITY_DECAY_ON_NOVELTY,
+    IDX_AROUSAL_BUMP_ON_OBSERVATION,
+    IDX_AROUSAL_BUMP_ON_FAILURE,
+    IDX_CONFIDENCE_DROP_ON_FAILURE,
+    IDX_CONFIDENCE_RISE_ON_SUCCESS,
+    IDX_CONFIDENCE_FLOOR_RISE_ON_RECOVERY,
+    IDX_CONFIDENCE_FLOOR_MAX,
+    IDX_HIGH_AROUSAL_THRESHOLD,
+    IDX_LOW_RECOVERY_THRESHOLD,
+    IDX_HIGH_AROUSAL_CYCLE_LIMIT,
+    IDX_LOW_RECOVERY_CYCLE_LIMIT,
+) = range(len(CONFIG_FIELDS))
+
+
+def config_tuple(cfg) -> Tuple[float, ...]:
+    """
+    Flatten a BackgroundConfig into a positional float tuple.
+
+    Built once per BackgroundCore; indexed with the IDX_* constants
+    on the Python path and unpacked wholesale by `regulate`.
+    """
+    return tuple(float(getattr(cfg, name)) for name in CONFIG_FIELDS)
+
+
+# ============================================================
+# Regulation Kernel
+# ============================================================
+
+@njit(cache=True)
+def regulate(
+    arousal,
+    valence,
+    confidence,
+    confidence_floor,
+    uncertainty,
+    curiosity,
+    high_arousal_cycles,
+    low_recovery_cycles,
+    obs,
+    new_total,
+    failure_rate,
+    activity_ratio,
+    stagnation,
+    cfg,
+):
+    """
+    One full regulation cycle on plain scalars.
+
+    Mirrors BackgroundCore._apply_experience / _apply_stagnation,
+    _clamp_all, _apply_confidence_floor_logic and _burnout_guard.
+
+    Returns the new state scalars, the burnout counters and the
+    two warning flags (high arousal, low recovery).
+    """
+    (
+        arousal_min, arousal_max,
+        confidence_min, confidence_max,
+        uncertainty_min, uncertainty_max,
+        curiosity_min, curiosity_max,
+        valence_min, valence_max,
+        arousal_decay,
+        uncertainty_decay_on_experience,
+        curiosity_rise_on_stagnation,
+        curiosity_decay_on_novelty,
+        arousal_bump_on_observation,
+        arousal_bump_on_failure,
+        confidence_drop_on_failure,
+        confidence_rise_on_success,
+        confidence_floor_rise_on_recovery,
+        confidence_floor_max,
+        high_arousal_threshold,
+        low_recovery_threshold,
+        high_arousal_cycle_limit,
+        low_recovery_cycle_limit,
+    ) = cfg
+
+    prev_arousal = arousal
+    prev_confidence = confidence
+
+    # Experience / stagnation
+    if stagnation:
+        curiosity += curiosity_rise_on_stagnation
+        arousal -= arousal_decay
+        uncertainty += 0.01
+        if confidence > confidence_floor:
+            confidence -= 0.01
+    else:
+        arousal += arousal_bump_on_observation * (obs / max(1.0, new_total))
+
+        if failure_rate > 0:
+            arousal += arousal_bump_on_failure * failure_rate
+            confidence -= confidence_drop_on_failure * failure_rate
+            uncertainty += 0.03 * failure_rate
+
+        success = max(0.0, 1.0 - failure_rate)
+        confidence += confidence_rise_on_success * success
+        uncertainty -= uncertainty_decay_on_experience * success
+        curiosity -= curiosity_decay_on_novelty * activity_ratio
+        arousal -= arousal_decay
+
+    # Clamp
+    arousal = max(arousal_min, min(arousal_max, arousal))
+    confidence = max(confidence_min, min(confidence_max, confidence))
+    confidence_floor = max(0.0, min(confidence_floor_max, confidence_floor))
+    uncertainty = max(uncertainty_min, min(uncertainty_max, uncertainty))
+    curiosity = max(curiosity_min, min(curiosity_max, curiosity))
+    valence = max(valence_min, min(valence_max, valence))
+
+    # Confidence floor
+    confidence = max(confidence, confidence_floor)
+
+    if arousal < prev_arousal and confidence > prev_confidence:
+        confidence_floor += confidence_floor_rise_on_recovery
+        confidence_floor = min(confidence_floor, confidence_floor_max)
+
+    # Burnout guard
+    if arousal >= high_arousal_threshold:
+        high_arousal_cycles += 1
+    else:
+        high_arousal_cycles = 0
+
+    gain = confidence - prev_confidence
+    if gain < low_recovery_threshold and arousal >= prev_arousal:
+        low_recovery_cycles += 1
+    else:
+        low_recovery_cycles = 0
+
+    warn_high = high_arousal_cycles >= high_arousal_cycle_limit
+    warn_low = low_recovery_cycles >= low_recovery_cycle_limit
+
+    return (
+        arousal,
+        valence,
+        confidence,
+        confidence_floor,
+        uncertainty,
+        curiosity,
+        high_arousal_cycles,
+        low_recovery_cycles,
+        warn_high,
+        warn_low,
+    )
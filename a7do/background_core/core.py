@@ -1,30 +1,170 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
-
+from dataclasses import InitVar, dataclass, field
+from functools import partial
+from itertools import islice
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from a7do.background_core._kernel import (
+    IDX_AROUSAL_BUMP_ON_FAILURE,
+    IDX_AROUSAL_BUMP_ON_OBSERVATION,
+    IDX_AROUSAL_DECAY,
+    IDX_CONFIDENCE_DROP_ON_FAILURE,
+    IDX_CONFIDENCE_FLOOR_MAX,
+    IDX_CONFIDENCE_FLOOR_RISE_ON_RECOVERY,
+    IDX_CONFIDENCE_RISE_ON_SUCCESS,
+    IDX_CURIOSITY_DECAY_ON_NOVELTY,
+    IDX_CURIOSITY_RISE_ON_STAGNATION,
+    IDX_HIGH_AROUSAL_CYCLE_LIMIT,
+    IDX_HIGH_AROUSAL_THRESHOLD,
+    IDX_LOW_RECOVERY_CYCLE_LIMIT,
+    IDX_LOW_RECOVERY_THRESHOLD,
+    IDX_UNCERTAINTY_DECAY_ON_EXPERIENCE,
+    NUMBA_AVAILABLE,
+    config_tuple,
+    regulate,
+)
 from shared.events import Event, EventType, internal, system_event
 from shared.memory import MemoryStore
 
 
+# ============================================================
+# Event Type Codes
+# ============================================================
+
+# Counter slot per event type. Small batches tally with a plain list
+# indexed by slot; large batches use a single np.bincount over the slots.
+_TYPE_TO_SLOT: Dict[EventType, int] = {
+    EventType.OBSERVATION: 0,
+    EventType.ACTION: 1,
+    EventType.OUTCOME: 2,
+    EventType.INTERNAL: 3,
+    EventType.SYSTEM: 4,
+}
+N_EVENT_TYPES = len(_TYPE_TO_SLOT)
+_OUTCOME_SLOT = _TYPE_TO_SLOT[EventType.OUTCOME]
+
+# Below this batch size numpy call overhead outweighs the vectorized pass
+_BINCOUNT_MIN_BATCH = 64
+
+# Rows pulled from memory per tally pass when catching up
+_STREAM_CHUNK = 1024
+
+
+def _tally_loop(new_events: List[Tuple[int, Event]]) -> Tuple[List[int], int, int]:
+    counts = [0] * N_EVENT_TYPES
+    failures = successes = 0
+    get = _TYPE_TO_SLOT.get
+
+    for _, e in new_events:
+        slot = get(e.type)
+        if slot is None:
+            continue
+        counts[slot] += 1
+        # Event.ok is None unless this is an OUTCOME with a bool "ok"
+        ok = e.ok
+        successes += ok is True
+        failures += ok is False
+
+    return counts, failures, successes
+
+
+def _tally_bincount(new_events: List[Tuple[int, Event]]) -> Tuple[List[int], int, int]:
+    slots = np.fromiter(
+        (_TYPE_TO_SLOT[e.type] for _, e in new_events),
+        dtype=np.int8,
+        count=len(new_events),
+    )
+    counts = np.bincount(slots, minlength=N_EVENT_TYPES).tolist()
+
+    # Only OUTCOME events carry ok/failed information
+    failures = successes = 0
+    for i in np.flatnonzero(slots == _OUTCOME_SLOT).tolist():
+        ok = new_events[i][1].ok
+        successes += ok is True
+        failures += ok is False
+
+    return counts, failures, successes
+
+
+# Signal for a cycle with no new events (shared, treat as read-only)
+_IDLE_SIGNAL: Dict[str, float] = {
+    "new_total": 0,
+    "obs": 0,
+    "act": 0,
+    "outcome": 0,
+    "internal": 0,
+    "system": 0,
+    "failure_rate": 0.0,
+    "activity_ratio": 0.0,
+}
+
+
+# Payload key order for each emitted event (single schema definition)
+_STATE_UPDATE_KEYS = ("cycles", "stagnation", "signal", "state")
+_LIGHT_TICK_KEYS = ("new_event_count", "delta", "state")
+_LIGHT_TICK_KEYS_NO_DELTA = ("new_event_count", "state")
+_WARN_HIGH_KEYS = ("cycles", "arousal")
+_WARN_LOW_KEYS = ("cycles", "confidence", "confidence_floor")
+
+# Shared result for the common no-warning cycle
+_NO_WARNINGS: Tuple[Event, ...] = ()
+
+
 # ============================================================
 # Background Core State
 # ============================================================
 
-@dataclass
+# Position of each regulated scalar inside BackgroundState.v
+AROUSAL, VALENCE, CONFIDENCE, CONFIDENCE_FLOOR, UNCERTAINTY, CURIOSITY = range(6)
+
+
+class BackgroundSnapshot(NamedTuple):
+    """
+    Immutable copy of the regulated scalars, in BackgroundState.v order.
+    """
+
+    arousal: float
+    valence: float
+    confidence: float
+    confidence_floor: float
+    uncertainty: float
+    curiosity: float
+
+
+def _slot(index: int) -> property:
+    """
+    Named float view onto one entry of BackgroundState.v.
+    """
+    def get(self) -> float:
+        return self.v.item(index)
+
+    def set(self, value: float) -> None:
+        self.v[index] = value
+
+    return property(get, set)
+
+
+@dataclass(slots=True, eq=False)
 class BackgroundState:
     """
     Minimal persistent internal state for Background Core.
 
     These are regulatory variables, not emotions.
+
+    The six regulated scalars are taken as keywords but live in one
+    float64 array `v` (see the AROUSAL ... CURIOSITY indices) so
+    clamping and snapshots operate on the whole vector at once.
     """
 
-    arousal: float = 0.15
-    valence: float = 0.0
-    confidence: float = 0.10
-    confidence_floor: float = 0.05
-    uncertainty: float = 0.85
-    curiosity: float = 0.25
+    arousal: InitVar[float] = 0.15
+    valence: InitVar[float] = 0.0
+    confidence: InitVar[float] = 0.10
+    confidence_floor: InitVar[float] = 0.05
+    uncertainty: InitVar[float] = 0.85
+    curiosity: InitVar[float] = 0.25
 
     # Cursor + counters
     last_seen_seq: int = 0
@@ -34,12 +174,46 @@ class BackgroundState:
     consecutive_high_arousal_cycles: int = 0
     consecutive_low_recovery_cycles: int = 0
 
+    v: np.ndarray = field(init=False)
+
+    def __post_init__(
+        self,
+        arousal: float,
+        valence: float,
+        confidence: float,
+        confidence_floor: float,
+        uncertainty: float,
+        curiosity: float,
+    ) -> None:
+        self.v = np.array(
+            [arousal, valence, confidence, confidence_floor, uncertainty, curiosity],
+            dtype=np.float64,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.v.tolist() == other.v.tolist()
+            and self.last_seen_seq == other.last_seen_seq
+            and self.cycles == other.cycles
+            and self.consecutive_high_arousal_cycles == other.consecutive_high_arousal_cycles
+            and self.consecutive_low_recovery_cycles == other.consecutive_low_recovery_cycles
+        )
+
+
+# Named float views onto v, set after the dataclass is built so they
+# do not replace the InitVar defaults
+for _index, _name in enumerate(BackgroundSnapshot._fields):
+    setattr(BackgroundState, _name, _slot(_index))
+del _index, _name
+
 
 # ============================================================
 # Background Core Config
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BackgroundConfig:
     # Bounds
     arousal_min: float = 0.02
@@ -79,6 +253,9 @@ class BackgroundConfig:
     high_arousal_cycle_limit: int = 6
     low_recovery_cycle_limit: int = 8
 
+    # Emission
+    emit_deltas: bool = True  # include per-tick "delta" in light_tick payloads
+
 
 # ============================================================
 # Background Core
@@ -100,6 +277,37 @@ class BackgroundCore:
         self.memory = memory
         self.cfg = config or BackgroundConfig()
 
+        # Hot config values as a plain tuple (see IDX_* in _kernel)
+        self._cfgv = config_tuple(self.cfg)
+
+        # Event constructors with the constant source pre-bound
+        self._emit_internal = partial(internal, source="background_core")
+        self._emit_system = partial(system_event, source="background_core")
+
+        # Clamp bounds, laid out like BackgroundState.v
+        self._lo = np.array(
+            [
+                self.cfg.arousal_min,
+                self.cfg.valence_min,
+                self.cfg.confidence_min,
+                0.0,
+                self.cfg.uncertainty_min,
+                self.cfg.curiosity_min,
+            ],
+            dtype=np.float64,
+        )
+        self._hi = np.array(
+            [
+                self.cfg.arousal_max,
+                self.cfg.valence_max,
+                self.cfg.confidence_max,
+                self.cfg.confidence_floor_max,
+                self.cfg.uncertainty_max,
+                self.cfg.curiosity_max,
+            ],
+            dtype=np.float64,
+        )
+
         # REQUIRED: explicit state creation
         self.state = BackgroundState()
 
@@ -110,59 +318,59 @@ class BackgroundCore:
     # Public API
     # --------------------------------------------------------
 
-    def step(self) -> List[Event]:
+    def step(self, out: Optional[List[Event]] = None) -> List[Event]:
         """
         Advance background regulation if new events exist.
+        With `out`, the emitted events are appended to it and `out` is
+        returned.
         """
-        new_events = list(self.memory.iter_since(self.state.last_seen_seq))
-        new_count = len(new_events)
-
-        if new_events:
-            self.state.last_seen_seq = new_events[-1][0]
-
-        if new_count >= self.cfg.cycle_event_threshold:
-            emitted = self._cycle(new_events, stagnation=False)
-        elif new_count <= self.cfg.stagnation_event_threshold:
-            emitted = self._cycle([], stagnation=True)
+        if self.memory.last_seq() == self.state.last_seen_seq:
+            emitted = self._idle_tick()
         else:
-            emitted = self._light_tick(new_count)
+            signal, new_count, self.state.last_seen_seq = self._extract_signals(
+                self.memory.iter_since(self.state.last_seen_seq)
+            )
+
+            if new_count >= self.cfg.cycle_event_threshold:
+                emitted = self._cycle(signal, stagnation=False)
+            elif new_count <= self.cfg.stagnation_event_threshold:
+                emitted = self._cycle(_IDLE_SIGNAL, stagnation=True)
+            else:
+                emitted = self._light_tick(new_count)
 
         if emitted:
             self.memory.append_many(emitted)
 
+        if out is not None:
+            out.extend(emitted)
+            return out
         return emitted
 
     # --------------------------------------------------------
     # Regulation Logic
     # --------------------------------------------------------
 
-    def _cycle(
-        self,
-        new_events: List[Tuple[int, Event]],
-        stagnation: bool,
-    ) -> List[Event]:
-        prev = self._snapshot()
-        signal = self._extract_signals(new_events)
-
-        if stagnation:
-            self._apply_stagnation()
+    def _cycle(self, signal: Dict[str, float], stagnation: bool) -> List[Event]:
+        if NUMBA_AVAILABLE:
+            warnings = self._regulate_compiled(signal, stagnation)
         else:
-            self._apply_experience(signal)
+            prev = self._snapshot()
+            if stagnation:
+                self._apply_stagnation()
+            else:
+                self._apply_experience(signal)
 
-        self._clamp_all()
-        self._apply_confidence_floor_logic(prev)
-        warnings = self._burnout_guard(prev)
+            self._clamp_all()
+            self._apply_confidence_floor_logic(prev)
+            warnings = self._burnout_guard(prev)
 
         emitted = [
-            internal(
-                source="background_core",
+            self._emit_internal(
                 name="state_update",
-                payload={
-                    "cycles": self.state.cycles,
-                    "stagnation": stagnation,
-                    "signal": signal,
-                    "state": self._snapshot(),
-                },
+                payload=dict(zip(
+                    _STATE_UPDATE_KEYS,
+                    (self.state.cycles, stagnation, signal, self._snapshot()._asdict()),
+                )),
                 confidence=self.state.confidence,
             )
         ]
@@ -171,35 +379,50 @@ class BackgroundCore:
         self.state.cycles += 1
         return emitted
 
+    def _idle_tick(self) -> List[Event]:
+        """
+        Nothing new in memory: same branch choice as step() with zero
+        events, without reading the log.
+        """
+        if self.cfg.cycle_event_threshold <= 0:
+            return self._cycle(_IDLE_SIGNAL, stagnation=False)
+        if self.cfg.stagnation_event_threshold >= 0:
+            return self._cycle(_IDLE_SIGNAL, stagnation=True)
+        return self._light_tick(0)
+
     def _light_tick(self, new_count: int) -> List[Event]:
-        prev = self._snapshot()
+        c = self._cfgv
+        prev = self._snapshot() if self.cfg.emit_deltas else None
 
-        self.state.arousal -= self.cfg.arousal_decay * 0.5
+        self.state.arousal -= c[IDX_AROUSAL_DECAY] * 0.5
 
         if new_count > 0:
-            self.state.uncertainty -= self.cfg.uncertainty_decay_on_experience * 0.25
-            self.state.curiosity -= self.cfg.curiosity_decay_on_novelty * 0.25
+            self.state.uncertainty -= c[IDX_UNCERTAINTY_DECAY_ON_EXPERIENCE] * 0.25
+            self.state.curiosity -= c[IDX_CURIOSITY_DECAY_ON_NOVELTY] * 0.25
         else:
-            self.state.curiosity += self.cfg.curiosity_rise_on_stagnation * 0.25
+            self.state.curiosity += c[IDX_CURIOSITY_RISE_ON_STAGNATION] * 0.25
 
-        if self.state.confidence < self.state.confidence_floor:
-            self.state.confidence = self.state.confidence_floor
-        else:
-            self.state.confidence -= 0.005
-            if self.state.confidence < self.state.confidence_floor:
-                self.state.confidence = self.state.confidence_floor
+        # Drift down, never below the floor (a state already under it is raised)
+        v = self.state.v
+        v[CONFIDENCE] = max(v.item(CONFIDENCE_FLOOR), v.item(CONFIDENCE) - 0.005)
 
         self._clamp_all()
 
+        if prev is None:
+            payload = dict(zip(
+                _LIGHT_TICK_KEYS_NO_DELTA,
+                (new_count, self._snapshot()._asdict()),
+            ))
+        else:
+            payload = dict(zip(
+                _LIGHT_TICK_KEYS,
+                (new_count, self._delta(prev)._asdict(), self._snapshot()._asdict()),
+            ))
+
         return [
-            internal(
-                source="background_core",
+            self._emit_internal(
                 name="light_tick",
-                payload={
-                    "new_event_count": new_count,
-                    "delta": self._delta(prev),
-                    "state": self._snapshot(),
-                },
+                payload=payload,
                 confidence=self.state.confidence,
             )
         ]
@@ -210,112 +433,173 @@ class BackgroundCore:
 
     def _extract_signals(
         self,
-        new_events: List[Tuple[int, Event]],
-    ) -> Dict[str, float]:
-        obs = act = outc = intr = sys = 0
+        rows: Iterable[Tuple[int, Event]],
+    ) -> Tuple[Dict[str, float], int, int]:
+        """
+        Single pass over new (seq, event) rows.
+
+        Rows are tallied in bounded chunks, so a long catch-up never holds
+        the whole window. Returns (signal, new_count, last_seq).
+        """
+        rows = iter(rows)
+        counts = [0] * N_EVENT_TYPES
         failures = successes = 0
+        new_count = 0
+        last_seq = self.state.last_seen_seq
+
+        while True:
+            chunk = list(islice(rows, _STREAM_CHUNK))
+            if not chunk:
+                break
+
+            if len(chunk) < _BINCOUNT_MIN_BATCH:
+                c, f, ok = _tally_loop(chunk)
+            else:
+                c, f, ok = _tally_bincount(chunk)
+
+            for i in range(N_EVENT_TYPES):
+                counts[i] += c[i]
+            failures += f
+            successes += ok
+            new_count += len(chunk)
+            last_seq = chunk[-1][0]
+
+            if len(chunk) < _STREAM_CHUNK:
+                break
 
-        for _, e in new_events:
-            if e.type == EventType.OBSERVATION:
-                obs += 1
-            elif e.type == EventType.ACTION:
-                act += 1
-            elif e.type == EventType.OUTCOME:
-                outc += 1
-                ok = e.payload.get("ok")
-                if ok is True:
-                    successes += 1
-                elif ok is False:
-                    failures += 1
-            elif e.type == EventType.INTERNAL:
-                intr += 1
-            elif e.type == EventType.SYSTEM:
-                sys += 1
-
-        total = max(1, len(new_events))
+        obs, act, outc, intr, sys = counts
+
+        total = max(1, new_count)
         failure_rate = failures / max(1, failures + successes)
 
-        return {
-            "new_total": float(len(new_events)),
-            "obs": float(obs),
-            "act": float(act),
-            "outcome": float(outc),
-            "internal": float(intr),
-            "system": float(sys),
-            "failure_rate": float(failure_rate),
-            "activity_ratio": float((obs + act + outc) / total),
+        signal = {
+            "new_total": new_count,
+            "obs": obs,
+            "act": act,
+            "outcome": outc,
+            "internal": intr,
+            "system": sys,
+            "failure_rate": failure_rate,
+            "activity_ratio": (obs + act + outc) / total,
         }
+        return signal, new_count, last_seq
 
     def _apply_experience(self, signal: Dict[str, float]) -> None:
-        self.state.arousal += self.cfg.arousal_bump_on_observation * (
+        c = self._cfgv
+        failure_rate = signal["failure_rate"]
+
+        self.state.arousal += c[IDX_AROUSAL_BUMP_ON_OBSERVATION] * (
             signal["obs"] / max(1.0, signal["new_total"])
         )
 
-        if signal["failure_rate"] > 0:
-            self.state.arousal += self.cfg.arousal_bump_on_failure * signal["failure_rate"]
-            self.state.confidence -= self.cfg.confidence_drop_on_failure * signal["failure_rate"]
-            self.state.uncertainty += 0.03 * signal["failure_rate"]
+        if failure_rate > 0:
+            self.state.arousal += c[IDX_AROUSAL_BUMP_ON_FAILURE] * failure_rate
+            self.state.confidence -= c[IDX_CONFIDENCE_DROP_ON_FAILURE] * failure_rate
+            self.state.uncertainty += 0.03 * failure_rate
 
-        success = max(0.0, 1.0 - signal["failure_rate"])
-        self.state.confidence += self.cfg.confidence_rise_on_success * success
-        self.state.uncertainty -= self.cfg.uncertainty_decay_on_experience * success
-        self.state.curiosity -= self.cfg.curiosity_decay_on_novelty * signal["activity_ratio"]
-        self.state.arousal -= self.cfg.arousal_decay
+        success = max(0.0, 1.0 - failure_rate)
+        self.state.confidence += c[IDX_CONFIDENCE_RISE_ON_SUCCESS] * success
+        self.state.uncertainty -= c[IDX_UNCERTAINTY_DECAY_ON_EXPERIENCE] * success
+        self.state.curiosity -= c[IDX_CURIOSITY_DECAY_ON_NOVELTY] * signal["activity_ratio"]
+        self.state.arousal -= c[IDX_AROUSAL_DECAY]
 
     def _apply_stagnation(self) -> None:
-        self.state.curiosity += self.cfg.curiosity_rise_on_stagnation
-        self.state.arousal -= self.cfg.arousal_decay
+        c = self._cfgv
+        self.state.curiosity += c[IDX_CURIOSITY_RISE_ON_STAGNATION]
+        self.state.arousal -= c[IDX_AROUSAL_DECAY]
         self.state.uncertainty += 0.01
         if self.state.confidence > self.state.confidence_floor:
             self.state.confidence -= 0.01
 
-    def _apply_confidence_floor_logic(self, prev: Dict[str, float]) -> None:
-        if self.state.confidence < self.state.confidence_floor:
-            self.state.confidence = self.state.confidence_floor
+    def _apply_confidence_floor_logic(self, prev: BackgroundSnapshot) -> None:
+        c = self._cfgv
+        self.state.confidence = max(self.state.confidence, self.state.confidence_floor)
 
-        if self.state.arousal < prev["arousal"] and self.state.confidence > prev["confidence"]:
-            self.state.confidence_floor += self.cfg.confidence_floor_rise_on_recovery
+        if self.state.arousal < prev.arousal and self.state.confidence > prev.confidence:
+            self.state.confidence_floor += c[IDX_CONFIDENCE_FLOOR_RISE_ON_RECOVERY]
             self.state.confidence_floor = min(
                 self.state.confidence_floor,
-                self.cfg.confidence_floor_max,
+                c[IDX_CONFIDENCE_FLOOR_MAX],
             )
 
-    def _burnout_guard(self, prev: Dict[str, float]) -> List[Event]:
-        warnings: List[Event] = []
-
-        if self.state.arousal >= self.cfg.high_arousal_threshold:
+    def _burnout_guard(self, prev: BackgroundSnapshot) -> Sequence[Event]:
+        c = self._cfgv
+        if self.state.arousal >= c[IDX_HIGH_AROUSAL_THRESHOLD]:
             self.state.consecutive_high_arousal_cycles += 1
         else:
             self.state.consecutive_high_arousal_cycles = 0
 
-        gain = self.state.confidence - prev["confidence"]
-        if gain < self.cfg.low_recovery_threshold and self.state.arousal >= prev["arousal"]:
+        gain = self.state.confidence - prev.confidence
+        if gain < c[IDX_LOW_RECOVERY_THRESHOLD] and self.state.arousal >= prev.arousal:
             self.state.consecutive_low_recovery_cycles += 1
         else:
             self.state.consecutive_low_recovery_cycles = 0
 
-        if self.state.consecutive_high_arousal_cycles >= self.cfg.high_arousal_cycle_limit:
+        return self._warnings(
+            self.state.consecutive_high_arousal_cycles >= c[IDX_HIGH_AROUSAL_CYCLE_LIMIT],
+            self.state.consecutive_low_recovery_cycles >= c[IDX_LOW_RECOVERY_CYCLE_LIMIT],
+        )
+
+    def _regulate_compiled(self, signal: Dict[str, float], stagnation: bool) -> Sequence[Event]:
+        """
+        Numba fast path: experience/stagnation, clamp, confidence floor
+        and burnout counters in a single compiled call.
+        """
+        s = self.state
+        (
+            s.arousal,
+            s.valence,
+            s.confidence,
+            s.confidence_floor,
+            s.uncertainty,
+            s.curiosity,
+            s.consecutive_high_arousal_cycles,
+            s.consecutive_low_recovery_cycles,
+            warn_high,
+            warn_low,
+        ) = regulate(
+            s.arousal,
+            s.valence,
+            s.confidence,
+            s.confidence_floor,
+            s.uncertainty,
+            s.curiosity,
+            s.consecutive_high_arousal_cycles,
+            s.consecutive_low_recovery_cycles,
+            signal["obs"],
+            signal["new_total"],
+            signal["failure_rate"],
+            signal["activity_ratio"],
+            stagnation,
+            self._cfgv,
+        )
+        return self._warnings(bool(warn_high), bool(warn_low))
+
+    def _warnings(self, high_arousal: bool, low_recovery: bool) -> Sequence[Event]:
+        if not (high_arousal or low_recovery):
+            return _NO_WARNINGS
+
+        warnings: List[Event] = []
+
+        if high_arousal:
             warnings.append(
-                system_event(
-                    source="background_core",
+                self._emit_system(
                     name="warning_high_arousal_persistence",
-                    payload={
-                        "cycles": self.state.cycles,
-                        "arousal": self.state.arousal,
-                    },
+                    payload=dict(zip(
+                        _WARN_HIGH_KEYS,
+                        (self.state.cycles, self.state.arousal),
+                    )),
                 )
             )
 
-        if self.state.consecutive_low_recovery_cycles >= self.cfg.low_recovery_cycle_limit:
+        if low_recovery:
             warnings.append(
-                system_event(
-                    source="background_core",
+                self._emit_system(
                     name="warning_low_recovery_persistence",
-                    payload={
-                        "cycles": self.state.cycles,
-                        "confidence": self.state.confidence,
-                        "confidence_floor": self.state.confidence_floor,
-                    },
+                    payload=dict(zip(
+                        _WARN_LOW_KEYS,
+                        (self.state.cycles, self.state.confidence, self.state.confidence_floor),
+                    )),
                 )
             )
 
@@ -325,27 +609,11 @@ class BackgroundCore:
     # Utilities
     # --------------------------------------------------------
 
-    def _clamp(self, v: float, lo: float, hi: float) -> float:
-        return max(lo, min(hi, v))
-
     def _clamp_all(self) -> None:
-        self.state.arousal = self._clamp(self.state.arousal, self.cfg.arousal_min, self.cfg.arousal_max)
-        self.state.confidence = self._clamp(self.state.confidence, self.cfg.confidence_min, self.cfg.confidence_max)
-        self.state.confidence_floor = self._clamp(self.state.confidence_floor, 0.0, self.cfg.confidence_floor_max)
-        self.state.uncertainty = self._clamp(self.state.uncertainty, self.cfg.uncertainty_min, self.cfg.uncertainty_max)
-        self.state.curiosity = self._clamp(self.state.curiosity, self.cfg.curiosity_min, self.cfg.curiosity_max)
-        self.state.valence = self._clamp(self.state.valence, self.cfg.valence_min, self.cfg.valence_max)
-
-    def _snapshot(self) -> Dict[str, float]:
-        return {
-            "arousal": self.state.arousal,
-            "valence": self.state.valence,
-            "confidence": self.state.confidence,
-            "confidence_floor": self.state.confidence_floor,
-            "uncertainty": self.state.uncertainty,
-            "curiosity": self.state.curiosity,
-        }
+        np.clip(self.state.v, self._lo, self._hi, out=self.state.v)
+
+    def _snapshot(self) -> BackgroundSnapshot:
+        return BackgroundSnapshot(*self.state.v.tolist())
 
-    def _delta(self, prev: Dict[str, float]) -> Dict[str, float]:
-        cur = self._snapshot()
-        return {k: cur[k] - prev[k] for k in cur}
\ No newline at end of file
+    def _delta(self, prev: BackgroundSnapshot) -> BackgroundSnapshot:
+        return BackgroundSnapshot(*(self.state.v - prev).tolist())
@@ -1,24 +1,49 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from functools import partial
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
+from a7do.cognition.cells import LOW32, pack_cell
 from shared.events import Event, EventType, internal
 
 
+# Below this many coordinates a plain dict loop beats numpy setup cost
+_VECTOR_MIN_BATCH = 32
+
+_PREDICTION_ERROR = sys.intern("prediction_error")
+
+
 # ============================================================
 # Boundary State
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class BoundaryState:
     """
     Tracks locations where movement repeatedly fails.
 
     We do NOT store walls.
     We store experienced resistance.
+
+    Cells inside the world live in `grid` (height x width counts);
+    anything outside it, or every cell when the world size is unknown,
+    lives in the sparse `hits` dict keyed by pack_cell(x, y).
     """
-    hits: Dict[Tuple[int, int], int]
+    hits: Dict[int, int]
+    grid: Optional[np.ndarray] = None
+
+
+def _group(ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Stable group-by: (unique ids, sort order, group starts, group sizes).
+    """
+    order = np.argsort(ids, kind="stable")
+    uniq, starts, counts = np.unique(ids[order], return_index=True, return_counts=True)
+    return uniq, order, starts, counts
 
 
 # ============================================================
@@ -36,54 +61,156 @@ class BoundaryDetector:
     - Only repeated resistance
     """
 
-    def __init__(self, threshold: int = 2) -> None:
-        self.state = BoundaryState(hits={})
+    def __init__(
+        self,
+        threshold: int = 2,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> None:
+        grid = None
+        if width is not None and height is not None:
+            grid = np.zeros((int(height), int(width)), dtype=np.int32)
+
+        self.state = BoundaryState(hits={}, grid=grid)
         self.threshold = int(threshold)
 
+        # Event constructor with the constant source/name pre-bound
+        self._emit_boundary = partial(internal, source="boundary", name="boundary_detected")
+
+        # Flat int view over the grid for cheap scalar updates
+        self._cells = memoryview(grid).cast("B").cast("i") if grid is not None else None
+
     # --------------------------------------------------------
     # Public API
     # --------------------------------------------------------
 
-    def observe(self, events: List[Event]) -> List[Event]:
+    def observe(self, events: List[Event], out: Optional[List[Event]] = None) -> List[Event]:
         """
         Observe prediction errors and detect boundary formation.
+        With `out` (which may be `events` itself), the new events are
+        appended to it and `out` is returned.
         """
-        emitted: List[Event] = []
+        xs: List[int] = []
+        ys: List[int] = []
+        append_x = xs.append
+        append_y = ys.append
+        internal_type = EventType.INTERNAL
 
         for e in events:
-            if e.type != EventType.INTERNAL:
+            if e.type is not internal_type:
                 continue
 
-            if e.name != "prediction_error":
+            if e.name != _PREDICTION_ERROR:
                 continue
 
             # We only care about movement-related prediction errors
-            expected = e.payload.get("expected", {})
             observed = e.payload.get("observed", {})
 
             # World typically reports attempted + resulting position
             pos = observed.get("position")
-            if not pos or not isinstance(pos, (list, tuple)):
+            if not pos:
                 continue
 
-            x, y = int(pos[0]), int(pos[1])
-            key = (x, y)
-
-            # Accumulate resistance
-            self.state.hits[key] = self.state.hits.get(key, 0) + 1
-
-            # If threshold crossed, emit boundary signal
-            if self.state.hits[key] == self.threshold:
-                emitted.append(
-                    internal(
-                        source="boundary",
-                        name="boundary_detected",
-                        payload={
-                            "position": {"x": x, "y": y},
-                            "hits": self.state.hits[key],
-                        },
-                        confidence=1.0,
-                    )
-                )
-
-        return emitted
\ No newline at end of file
+            # Exact-class check first; isinstance only for subclasses
+            cls = pos.__class__
+            if cls is not list and cls is not tuple and not isinstance(pos, (list, tuple)):
+                continue
+
+            append_x(int(pos[0]))
+            append_y(int(pos[1]))
+
+        emitted: List[Event] = [] if out is None else out
+        if not xs:
+            return emitted
+
+        if len(xs) < _VECTOR_MIN_BATCH:
+            crossed = self._accumulate_loop(xs, ys)
+        else:
+            crossed = self._accumulate_vector(xs, ys)
+
+        threshold = self.threshold
+        emit = self._emit_boundary
+        emitted.extend(
+            emit(
+                payload={
+                    "position": {"x": xs[i], "y": ys[i]},
+                    "hits": threshold,
+                },
+                confidence=1.0,
+            )
+            for i in crossed
+        )
+        return emitted
+
+    # --------------------------------------------------------
+    # Internals
+    # --------------------------------------------------------
+
+    def _accumulate_loop(self, xs: List[int], ys: List[int]) -> List[int]:
+        """
+        Accumulate resistance; return batch positions of the hits that
+        reached the threshold, in order.
+        """
+        cells = self._cells
+        hits = self.state.hits
+        if cells is not None:
+            height, width = self.state.grid.shape
+        crossed: List[int] = []
+
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            if cells is not None and 0 <= x < width and 0 <= y < height:
+                c = y * width + x
+                n = cells[c] + 1
+                cells[c] = n
+            else:
+                key = pack_cell(x, y)
+                n = hits.get(key, 0) + 1
+                hits[key] = n
+
+            if n == self.threshold:
+                crossed.append(i)
+
+        return crossed
+
+    def _accumulate_vector(self, xs: List[int], ys: List[int]) -> List[int]:
+        """
+        Same as _accumulate_loop, grouped per cell with numpy.
+        """
+        x = np.asarray(xs, dtype=np.int64)
+        y = np.asarray(ys, dtype=np.int64)
+        at = np.arange(len(xs))
+        threshold = self.threshold
+        crossed: List[int] = []
+
+        grid = self.state.grid
+        if grid is not None:
+            height, width = grid.shape
+            inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+        else:
+            inside = np.zeros(len(xs), dtype=bool)
+
+        if inside.any():
+            flat = grid.reshape(-1)
+            uniq, order, starts, counts = _group(y[inside] * width + x[inside])
+            prev = flat[uniq].astype(np.int64)
+            flat[uniq] = prev + counts
+
+            reached = (prev < threshold) & (threshold <= prev + counts)
+            nth = starts[reached] + (threshold - prev[reached] - 1)
+            crossed.extend(at[inside][order[nth]].tolist())
+
+        outside = ~inside
+        if outside.any():
+            keys = (x[outside] << 32) | (y[outside] & LOW32)
+            uniq, order, starts, counts = _group(keys)
+            hits = self.state.hits
+            positions = at[outside][order]
+
+            for key, start, count in zip(uniq.tolist(), starts.tolist(), counts.tolist()):
+                prev = hits.get(key, 0)
+                hits[key] = prev + count
+                if prev < threshold <= prev + count:
+                    crossed.append(int(positions[start + threshold - prev - 1]))
+
+        crossed.sort()
+        return crossed
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+
+# ============================================================
+# Cell Keys
+# ============================================================
+# A grid cell (x, y) packed into one int: x in the high 32 bits,
+# y (two's complement) in the low 32. Ints hash in O(1) and need
+# no per-lookup allocation, unlike tuple or string keys.
+
+LOW32 = 0xFFFFFFFF
+_SIGN32 = 0x80000000
+
+
+def pack_cell(x: int, y: int) -> int:
+    """
+    Pack a signed (x, y) cell into one int64-compatible key.
+    """
+    return (x << 32) | (y & LOW32)
+
+
+def unpack_cell(key: int) -> Tuple[int, int]:
+    """
+    Inverse of pack_cell (sign-safe for negative coordinates).
+    """
+    return key >> 32, ((key & LOW32) ^ _SIGN32) - _SIGN32
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from functools import partial
 from typing import Dict, List, Optional
 
 from shared.events import Event, EventType, internal
 
 
+_ACTION = EventType.ACTION
+_OUTCOME = EventType.OUTCOME
+_MOVE = sys.intern("move")
+
+
 # ============================================================
 # Prediction State
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class PredictionState:
     """
     Minimal predictive memory.
@@ -38,51 +45,58 @@ class PredictionEngine:
     def __init__(self) -> None:
         self.state = PredictionState()
 
+        # Event constructors with the constant source/name pre-bound
+        self._emit_error = partial(internal, source="prediction", name="prediction_error")
+        self._emit_confirmed = partial(internal, source="prediction", name="expectation_confirmed")
+
     # --------------------------------------------------------
     # Public API
     # --------------------------------------------------------
 
-    def observe(self, events: List[Event]) -> List[Event]:
+    def observe(self, events: List[Event], out: Optional[List[Event]] = None) -> List[Event]:
         """
         Inspect recent events and emit:
         - prediction_error
         - expectation_confirmed (when appropriate)
+
+        With `out` (which may be `events` itself), the new events are
+        appended to it and `out` is returned.
         """
-        emitted: List[Event] = []
+        emitted: List[Event] = [] if out is None else out
+        action_type = _ACTION
+        outcome_type = _OUTCOME
 
-        for e in events:
+        # Only actions and outcomes move the expectation; keep their order
+        for e in [e for e in events if e.type is action_type or e.type is outcome_type]:
             # --------------------------------------------
             # Action → expectation
             # --------------------------------------------
-            if e.type == EventType.ACTION:
+            if e.type is action_type:
                 self.state.expected = self._expect_from_action(e)
 
             # --------------------------------------------
             # Outcome → resolve expectation
             # --------------------------------------------
-            elif e.type == EventType.OUTCOME and self.state.expected is not None:
+            elif self.state.expected is not None:
                 error = self._compute_error(self.state.expected, e)
 
                 # Always emit prediction error
                 emitted.append(
-                    internal(
-                        source="prediction",
-                        name="prediction_error",
+                    self._emit_error(
                         payload={
                             "error": error,
                             "expected": self.state.expected,
                             "observed": e.payload,
                         },
-                        confidence=max(0.0, 1.0 - min(1.0, error)),
+                        # L1 error is >= 0, so only the upper clamp matters
+                        confidence=1.0 - error if error < 1.0 else 0.0,
                     )
                 )
 
                 # Emit confirmation if error is sufficiently low
                 if error < 0.1:
                     emitted.append(
-                        internal(
-                            source="prediction",
-                            name="expectation_confirmed",
+                        self._emit_confirmed(
                             payload={
                                 "expected": self.state.expected,
                                 "observed": e.payload,
@@ -106,7 +120,7 @@ class PredictionEngine:
 
         Currently supports movement only.
         """
-        if e.name == "move":
+        if e.name == _MOVE:
             dx = float(e.payload.get("dx", 0))
             dy = float(e.payload.get("dy", 0))
             return {
@@ -1,23 +1,114 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from functools import partial
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
+from a7do.cognition.cells import pack_cell, unpack_cell
 from shared.events import Event, EventType, internal
 
 
+# Event kinds this engine reacts to (names compared with ==)
+_INTERNAL = EventType.INTERNAL
+_EXPECTATION_CONFIRMED = sys.intern("expectation_confirmed")
+_PREDICTION_ERROR = sys.intern("prediction_error")
+
+# Shared stand-in for a missing "observed" payload (never mutated)
+_EMPTY: Dict[str, object] = {}
+
+# batch_mode only aggregates batches at least this large
+_BATCH_MIN_EVENTS = 256
+
+# Initial score rows; doubled whenever full
+_INITIAL_CAPACITY = 64
+
+
+def key_label(key: int) -> str:
+    """
+    External form of a preference key, as carried in event payloads.
+    """
+    x, y = unpack_cell(key)
+    return f"pos:{x},{y}"
+
+
+def _gate_and_key(e: Event) -> Optional[Tuple[int, Optional[float]]]:
+    """
+    (key, error) for an event that moves a preference, else None.
+
+    Cheap signal gate first; key extraction only for survivors.
+    error is None for a confirmation.
+    """
+    if e.type is not _INTERNAL:
+        return None
+
+    name = e.name
+    if name == _EXPECTATION_CONFIRMED:
+        error = None
+    elif name == _PREDICTION_ERROR:
+        error = float(e.payload.get("error", 0.0))
+        if error < 0.3:
+            return None
+    else:
+        return None
+
+    # Key: movement preference by resulting position
+    pos = (e.payload.get("observed") or _EMPTY).get("position")
+    if not pos:
+        return None
+    cls = pos.__class__
+    if cls is not list and cls is not tuple and not isinstance(pos, (list, tuple)):
+        return None
+    return pack_cell(int(pos[0]), int(pos[1])), error
+
+
 # ============================================================
 # Preference State
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class PreferenceState:
     """
     Stores emergent preferences.
 
     Keyed by simple feature signatures (e.g. positions, actions).
+    Positions use the pack_cell(x, y) layout; see key_label() for the
+    text form.
+
+    Scores live in one float64 column (`values`); `index` maps each key
+    to its row, in first-seen order. `scores` is the labelled view.
     """
-    scores: Dict[str, float]
+    index: Dict[int, int] = field(default_factory=dict)
+    values: np.ndarray = field(default_factory=lambda: np.zeros(_INITIAL_CAPACITY))
+    size: int = 0
+
+    def slot(self, key: int) -> int:
+        """
+        Row for key, allocating a zero score on first sight.
+        """
+        i = self.index.get(key)
+        if i is None:
+            i = self.size
+            if i == self.values.shape[0]:
+                grown = np.zeros(2 * i)
+                grown[:i] = self.values
+                self.values = grown
+            self.index[key] = i
+            self.size = i + 1
+        return i
+
+    @property
+    def scores(self) -> Dict[str, float]:
+        """
+        Scores keyed by key_label(), as before the column layout.
+        A fresh dict on each access; updates go through slot().
+        """
+        return {
+            key_label(key): score
+            for key, score in zip(self.index, self.values[: self.size].tolist())
+        }
 
 
 # ============================================================
@@ -33,76 +124,74 @@ class PreferenceEngine:
     - No goals
     - No emotions
     - Pure bias accumulation
+
+    batch_mode (for bulk replay): large batches are aggregated per key
+    and emit one preference_updated per key instead of one per event.
     """
 
-    def __init__(self, learning_rate: float = 0.05) -> None:
-        self.state = PreferenceState(scores={})
+    def __init__(self, learning_rate: float = 0.05, batch_mode: bool = False) -> None:
+        self.state = PreferenceState()
         self.lr = float(learning_rate)
+        self.batch_mode = bool(batch_mode)
+
+        # Event constructor with the constant source/name pre-bound
+        self._emit_updated = partial(internal, source="preference", name="preference_updated")
 
     # --------------------------------------------------------
     # Public API
     # --------------------------------------------------------
 
     def observe(self, events: List[Event]) -> List[Event]:
+        if self.batch_mode and len(events) >= _BATCH_MIN_EVENTS:
+            return self._observe_batch(events)
+
         emitted: List[Event] = []
 
+        # Hot-loop locals
+        state = self.state
+        slot = state.slot
+        lr = self.lr
+        append = emitted.append
+        emit_updated = self._emit_updated
+        gate_and_key = _gate_and_key
+
         for e in events:
-            if e.type != EventType.INTERNAL:
+            hit = gate_and_key(e)
+            if hit is None:
                 continue
+            key, error = hit
 
-            # --------------------------------------------
-            # Positive preference formation
-            # --------------------------------------------
-            if e.name == "expectation_confirmed":
-                key = self._key_from_event(e)
-                if not key:
-                    continue
-
-                prev = self.state.scores.get(key, 0.0)
-                new = prev + self.lr
-                self.state.scores[key] = new
-
-                emitted.append(
-                    internal(
-                        source="preference",
-                        name="preference_updated",
-                        payload={
-                            "key": key,
-                            "delta": +self.lr,
-                            "score": new,
-                        },
-                        confidence=min(1.0, new),
-                    )
-                )
+            if error is None:
+                # --------------------------------------------
+                # Positive preference formation
+                # --------------------------------------------
+                delta = +lr
+            else:
+                # --------------------------------------------
+                # Negative preference (persistent surprise)
+                # --------------------------------------------
+                delta = -lr * error
 
-            # --------------------------------------------
-            # Negative preference (persistent surprise)
-            # --------------------------------------------
-            elif e.name == "prediction_error":
-                error = float(e.payload.get("error", 0.0))
-                if error < 0.3:
-                    continue
-
-                key = self._key_from_event(e)
-                if not key:
-                    continue
-
-                prev = self.state.scores.get(key, 0.0)
-                new = prev - self.lr * error
-                self.state.scores[key] = new
-
-                emitted.append(
-                    internal(
-                        source="preference",
-                        name="preference_updated",
-                        payload={
-                            "key": key,
-                            "delta": -self.lr * error,
-                            "score": new,
-                        },
-                        confidence=max(0.0, 1.0 - error),
-                    )
+            i = slot(key)
+            values = state.values  # may have grown in slot()
+            new = values.item(i) + delta
+            values[i] = new
+
+            if error is None:
+                confidence = new if new < 1.0 else 1.0
+            else:
+                confidence = 1.0 - error if error < 1.0 else 0.0
+
+            append(
+                emit_updated(
+                    payload={
+                        "key": key_label(key),
+                        "delta": delta,
+                        "score": new,
+                    },
+                    confidence=confidence,
                 )
+            )
 
         return emitted
 
@@ -110,16 +199,72 @@ class PreferenceEngine:
     # Internals
     # --------------------------------------------------------
 
-    def _key_from_event(self, e: Event) -> Optional[str]:
+    def _observe_batch(self, events: List[Event]) -> List[Event]:
         """
-        Reduce an event to a stable preference key.
-
-        For now:
-        - movement preference by resulting position
+        Aggregated update: same gating and keys as observe(), but each
+        key's deltas are summed and applied once. Keys are emitted in
+        order of first appearance; confidence follows the sign of the
+        summed delta (score for gains, 1 - mean error for losses).
         """
-        obs = e.payload.get("observed", {})
-        pos = obs.get("position")
-        if pos and isinstance(pos, (list, tuple)):
-            return f"pos:{int(pos[0])},{int(pos[1])}"
+        keys: List[int] = []
+        errors: List[float] = []  # 0.0 marks a confirmation
+
+        for e in events:
+            hit = _gate_and_key(e)
+            if hit is None:
+                continue
+            key, error = hit
+            keys.append(key)
+            errors.append(0.0 if error is None else error)
 
-        return None
\ No newline at end of file
+        if not keys:
+            return []
+
+        err = np.asarray(errors, dtype=np.float64)
+        is_err = err > 0.0
+        deltas = np.where(is_err, -self.lr * err, self.lr)
+
+        uniq, first, inv = np.unique(
+            np.asarray(keys, dtype=np.int64),
+            return_index=True,
+            return_inverse=True,
+        )
+        delta_sum = np.bincount(inv, weights=deltas)
+        err_sum = np.bincount(inv, weights=err)
+        err_n = np.bincount(inv, weights=is_err)
+
+        state = self.state
+        emit_updated = self._emit_updated
+        emitted: List[Event] = []
+
+        # Apply all per-key sums in one vector op, new keys in first-seen order
+        appearance = np.argsort(first, kind="stable")
+        rows = np.empty(len(uniq), dtype=np.int64)
+        for j in appearance.tolist():
+            rows[j] = state.slot(int(uniq[j]))
+        state.values[rows] += delta_sum
+        new_scores = state.values[rows].tolist()
+
+        for j in appearance.tolist():
+            key = int(uniq[j])
+            delta = float(delta_sum[j])
+            new = new_scores[j]
+
+            if delta >= 0.0:
+                confidence = new if new < 1.0 else 1.0
+            else:
+                mean_err = float(err_sum[j] / err_n[j])
+                confidence = 1.0 - mean_err if mean_err < 1.0 else 0.0
+
+            emitted.append(
+                emit_updated(
+                    payload={
+                        "key": key_label(key),
+                        "delta": delta,
+                        "score": new,
+                    },
+                    confidence=confidence,
+                )
+            )
+
+        return emitted
@@ -1,18 +1,25 @@
 from __future__ import annotations
 
 import random
+import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 
 from shared.events import Event, EventType, action
 from shared.memory import MemoryStore
 
 
+# Cardinal moves; index order is fixed so a failed move maps to one slot
+_MOVES: Tuple[Tuple[int, int], ...] = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+_STATE_UPDATE = sys.intern("state_update")
+
+
 # ============================================================
 # Agent State (Minimal)
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     """
     Minimal cognition-facing state.
@@ -59,9 +66,7 @@ class A7DOAgent:
 
         This is called after the Background Core step.
         """
-        recent = self._recent_events(20)
-
-        internal = self._latest_internal_state(recent)
+        internal = self._latest_internal_state(self._recent_newest_first(20))
         if not internal:
             return None
 
@@ -87,16 +92,16 @@ class A7DOAgent:
         # Movement selection
         # ----------------------------
 
-        moves = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+        # Avoid repeating last failed move (uniform over the other three)
+        if self.state.last_action_failed and self.state.last_move in _MOVES:
+            failed = _MOVES.index(self.state.last_move)
+            i = random.randrange(3)
+            if i >= failed:
+                i += 1
+        else:
+            i = random.getrandbits(2)
 
-        # Avoid repeating last failed move
-        if self.state.last_action_failed and self.state.last_move in moves:
-            moves.remove(self.state.last_move)
-
-        if not moves:
-            return None
-
-        dx, dy = random.choice(moves)
+        dx, dy = _MOVES[i]
 
         act = action(
             source="a7do",
@@ -117,9 +122,8 @@ class A7DOAgent:
         """
         Update internal bias state from recent outcomes.
         """
-        recent = self._recent_events(10)
-        for _, e in reversed(recent):
-            if e.type == EventType.OUTCOME and e.parent_id:
+        for _, e in self._recent_newest_first(10):
+            if e.type is EventType.OUTCOME and e.parent_id:
                 ok = e.payload.get("ok", None)
                 if ok is False:
                     self.state.last_action_failed = True
@@ -131,12 +135,18 @@ class A7DOAgent:
     # Utilities
     # ----------------------------
 
-    def _recent_events(self, n: int) -> List[Tuple[int, Event]]:
-        start = max(0, self.memory.last_seq() - n)
-        return list(self.memory.iter_since(start))
-
-    def _latest_internal_state(self, recent: List[Tuple[int, Event]]) -> Optional[Dict[str, float]]:
-        for _, e in reversed(recent):
-            if e.type == EventType.INTERNAL and e.name == "state_update":
+    def _recent_newest_first(self, n: int) -> Iterable[Tuple[int, Event]]:
+        # Rows of the last n seqs, served from the store's ring (which
+        # also holds appends of a still-open transaction)
+        rows = list(self.memory.iter_since(self.memory.last_seq() - n))
+        rows.reverse()
+        return rows
+
+    def _latest_internal_state(
+        self,
+        recent: Iterable[Tuple[int, Event]],
+    ) -> Optional[Dict[str, float]]:
+        for _, e in recent:
+            if e.type is EventType.INTERNAL and e.name == _STATE_UPDATE:
                 return e.payload.get("state", {})
         return None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
@@ -7,6 +8,12 @@ from typing import Any, Dict, List, Optional, Tuple
 from shared.events import Event, EventType
 
 
+# Observation names (interned; Event interns its name)
+_POSITION = sys.intern("position")
+_COLLISION = sys.intern("collision")
+_BOUNDARY_CONTACT = sys.intern("boundary_contact")
+
+
 # ============================================================
 # Percept Types (No Semantics)
 # ============================================================
@@ -23,7 +30,7 @@ class PerceptType(str, Enum):
 # Percept Object
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Percept:
     """
     A structured interpretation of an event, still non-semantic.
@@ -56,11 +63,14 @@ class PerceptionEngine:
 
     def process(self, events: List[Event]) -> List[Percept]:
         percepts: List[Percept] = []
+        observation_type = EventType.OBSERVATION
+        outcome_type = EventType.OUTCOME
 
         for e in events:
-            if e.type == EventType.OBSERVATION:
+            t = e.type
+            if t is observation_type:
                 percepts.extend(self._from_observation(e))
-            elif e.type == EventType.OUTCOME:
+            elif t is outcome_type:
                 percepts.append(self._from_outcome(e))
             else:
                 # other event types are not perceptual input
@@ -75,9 +85,15 @@ class PerceptionEngine:
     def _from_observation(self, e: Event) -> List[Percept]:
         out: List[Percept] = []
 
-        if e.name == "position":
-            x = int(e.payload.get("x"))
-            y = int(e.payload.get("y"))
+        if e.name == _POSITION:
+            px = e.payload.get("x")
+            py = e.payload.get("y")
+            if px is None or py is None:
+                # Partial position report: nothing to perceive
+                return out
+
+            x = int(px)
+            y = int(py)
             self._last_position = (x, y)
             out.append(
                 Percept(
@@ -88,7 +104,7 @@ class PerceptionEngine:
             )
             return out
 
-        if e.name == "collision":
+        if e.name == _COLLISION:
             # contact with a solid object
             out.append(
                 Percept(
@@ -102,7 +118,7 @@ class PerceptionEngine:
             )
             return out
 
-        if e.name == "boundary_contact":
+        if e.name == _BOUNDARY_CONTACT:
             out.append(
                 Percept(
                     type=PerceptType.BOUNDARY,
@@ -120,7 +136,8 @@ class PerceptionEngine:
             Percept(
                 type=PerceptType.UNKNOWN,
                 source_event_id=e.id,
-                payload={"name": e.name, "payload": dict(e.payload)},
+                # Event payloads are treated as read-only: share, don't copy
+                payload={"name": e.name, "payload": e.payload},
             )
         )
         return out
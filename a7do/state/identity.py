@@ -2,16 +2,21 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 from uuid import uuid4
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
 
 # ============================================================
 # Identity Record (Minimal & Persistent)
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IdentityRecord:
     """
     Minimal persistent identity for A7DO.
@@ -31,6 +36,17 @@ class IdentityRecord:
     notes: Optional[str] = None
 
 
+# Keys every identity file must carry (notes is optional)
+_REQUIRED_FIELDS = (
+    "identity_id",
+    "genesis_id",
+    "creation_tag",
+    "incarnation",
+    "continuity_version",
+)
+_INT_FIELDS = ("incarnation", "continuity_version")
+
+
 # ============================================================
 # Identity Store
 # ============================================================
@@ -58,6 +74,7 @@ class IdentityStore:
         self._identity: Optional[IdentityRecord] = None
 
         self._ensure_dir()
+        self._dir_fd = self._open_dir()
         self._load_or_create()
 
     # ----------------------------
@@ -72,6 +89,14 @@ class IdentityStore:
     def exists(self) -> bool:
         return self._identity is not None
 
+    def close(self) -> None:
+        """
+        Release the cached directory handle (safe to call twice).
+        """
+        if self._dir_fd is not None:
+            os.close(self._dir_fd)
+            self._dir_fd = None
+
     # ----------------------------
     # Controlled lifecycle
     # ----------------------------
@@ -125,6 +150,17 @@ class IdentityStore:
         if d and not os.path.exists(d):
             os.makedirs(d, exist_ok=True)
 
+    def _open_dir(self) -> Optional[int]:
+        """
+        Directory fd used to make renames durable (POSIX only).
+        """
+        if not hasattr(os, "O_DIRECTORY"):
+            return None
+        try:
+            return os.open(os.path.dirname(os.path.abspath(self.path)), os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return None
+
     def _load_or_create(self) -> None:
         if os.path.exists(self.path):
             self._identity = self._read()
@@ -147,20 +183,43 @@ class IdentityStore:
         self._identity = rec
 
     def _read(self) -> IdentityRecord:
-        with open(self.path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        return IdentityRecord(
-            identity_id=data["identity_id"],
-            genesis_id=data["genesis_id"],
-            creation_tag=data["creation_tag"],
-            incarnation=int(data["incarnation"]),
-            continuity_version=int(data["continuity_version"]),
-            notes=data.get("notes"),
-        )
+        with open(self.path, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+        fields = {k: data[k] for k in _REQUIRED_FIELDS}
+
+        # Files we wrote already hold JSON ints; coerce only hand-edited values
+        for k in _INT_FIELDS:
+            if fields[k].__class__ is not int:
+                fields[k] = int(fields[k])
+
+        return IdentityRecord(**fields, notes=data.get("notes"))
+
+    def _to_dict(self, rec: IdentityRecord) -> Dict[str, Any]:
+        # Flat record: explicit fields, no dataclasses.asdict recursion
+        return {
+            "identity_id": rec.identity_id,
+            "genesis_id": rec.genesis_id,
+            "creation_tag": rec.creation_tag,
+            "incarnation": rec.incarnation,
+            "continuity_version": rec.continuity_version,
+            "notes": rec.notes,
+        }
 
     def _write(self, rec: IdentityRecord) -> None:
+        if orjson is not None:
+            data = orjson.dumps(self._to_dict(rec), option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self._to_dict(rec), indent=2).encode("utf-8")
+
+        # write -> fsync -> rename -> fsync(dir): the swap survives a crash
         tmp = self.path + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(asdict(rec), f, indent=2)
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
         os.replace(tmp, self.path)
+
+        if self._dir_fd is not None:
+            os.fsync(self._dir_fd)
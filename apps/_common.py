@@ -0,0 +1,211 @@
+# ============================================================
+# Shared Streamlit building blocks for the A7DO apps
+# ============================================================
+
+from __future__ import annotations
+
+import atexit
+import json
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import streamlit as st
+
+from bootstrap.system import SystemBootstrap
+from shared.memory import STATE_FIELDS
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# ------------------------------------------------------------
+# Shared system (one per server process, not per session)
+# ------------------------------------------------------------
+
+@st.cache_resource
+def get_system() -> SystemBootstrap:
+    system = SystemBootstrap(enable_autonomy=False)
+    atexit.register(system.close)
+    return system
+
+
+@st.cache_resource
+def _system_lock() -> threading.RLock:
+    # Sessions run on separate script threads; one of them at a time
+    return threading.RLock()
+
+
+@contextmanager
+def system_lock() -> Iterator[None]:
+    """
+    Exclusive access to the shared system for the duration of the block.
+    """
+    with _system_lock():
+        yield
+
+
+def session_system(autonomy_default: bool = False) -> SystemBootstrap:
+    """
+    The shared system. Autonomy is a per-session choice kept in
+    session_state and passed to each step, never set on the system.
+    """
+    st.session_state.setdefault("enable_autonomy", autonomy_default)
+    return get_system()
+
+
+def autonomy_checkbox(container: Any = st.sidebar) -> None:
+    st.session_state.enable_autonomy = container.checkbox(
+        "Enable Autonomy",
+        value=st.session_state.enable_autonomy,
+    )
+
+
+def step_system(system: SystemBootstrap, user_text: Optional[str] = None) -> None:
+    with system_lock():
+        system.step(user_text, autonomy=st.session_state.enable_autonomy)
+
+
+def move_system(system: SystemBootstrap, dx: int, dy: int) -> None:
+    with system_lock():
+        system.apply_move(dx, dy)
+
+
+# ------------------------------------------------------------
+# Cached views (keyed on the memory's last seq; _system is not hashed)
+# ------------------------------------------------------------
+
+ALL_STATE_EVENTS = ("state_update", "light_tick")
+
+
+@st.cache_data(max_entries=4)
+def state_df(
+    _system: SystemBootstrap,
+    last_seq: int,
+    limit: int = 200,
+    names: Tuple[str, ...] = ALL_STATE_EVENTS,
+) -> "pd.DataFrame":
+    # Imported here: pages without a state chart never load pandas
+    import pandas as pd
+
+    return pd.DataFrame.from_records(
+        _system.memory.recent_states(limit, names=names),
+        columns=STATE_FIELDS,
+    )
+
+
+@st.cache_data(max_entries=4)
+def recent_text(_system: SystemBootstrap, last_seq: int, n: int = 40) -> str:
+    return "\n".join(e.summary() for e in _system.memory.recent(n))
+
+
+def cached_snapshot(system: SystemBootstrap, last_seq: int) -> Dict[str, Any]:
+    """
+    system.snapshot() reused across reruns that appended no events
+    (e.g. toggling a checkbox). Kept per session in session_state,
+    with the health and phase parts pre-serialized to JSON text.
+    """
+    if st.session_state.get("_snapshot_seq") != last_seq:
+        snap = system.snapshot()
+        snap["health_json"] = json.dumps(snap["health"], indent=2, default=str)
+        snap["phase_json"] = json.dumps(snap["phase"], indent=2, default=str)
+        st.session_state["_snapshot"] = snap
+        st.session_state["_snapshot_seq"] = last_seq
+    return st.session_state["_snapshot"]
+
+
+# ------------------------------------------------------------
+# World grid raster (preallocated uint8 buffer)
+# ------------------------------------------------------------
+
+CELL = 48
+GRID_LINE = (96, 96, 96)
+AGENT_COLOR = (255, 255, 255)
+
+
+@st.cache_resource
+def _grid_buffers(size_x: int, size_y: int) -> Tuple[np.ndarray, np.ndarray, List[Any]]:
+    """
+    Blank RGB grid (cell borders drawn once), the persistent frame that
+    is shown, and a one-slot list holding the cell currently painted.
+    """
+    base = np.zeros((size_y * CELL, size_x * CELL, 3), dtype=np.uint8)
+    base[::CELL, :] = GRID_LINE
+    base[:, ::CELL] = GRID_LINE
+    base[-1, :] = GRID_LINE
+    base[:, -1] = GRID_LINE
+    return base, base.copy(), [None]
+
+
+def _cell(x: int, y: int) -> Tuple[slice, slice]:
+    # Interior of a cell, inside its top/left border line
+    return slice(y * CELL + 1, (y + 1) * CELL), slice(x * CELL + 1, (x + 1) * CELL)
+
+
+def render_grid(size_x: int, size_y: int, agent: Optional[Tuple[int, int]]) -> np.ndarray:
+    """
+    Repaint only the cells that changed: the one the agent left and
+    the one it is in now. No per-render allocation or full-frame copy.
+    The frame is shared across sessions; call under system_lock().
+    """
+    base, frame, painted = _grid_buffers(size_x, size_y)
+    cell = tuple(agent) if agent else None
+    if painted[0] != cell:
+        if painted[0] is not None:
+            block = _cell(*painted[0])
+            frame[block] = base[block]
+        if cell is not None:
+            frame[_cell(*cell)] = AGENT_COLOR
+        painted[0] = cell
+    return frame
+
+
+# ============================================================
+# Renderers
+# ============================================================
+
+def render_world(system: SystemBootstrap) -> None:
+    # The grid frame is shared by every session: repaint it and hand it
+    # to st.image (which encodes it) before another session can repaint
+    with system_lock():
+        world = system.world.snapshot()
+        size_x, size_y = world["size"]
+        st.image(render_grid(size_x, size_y, world.get("agent")), channels="RGB")
+
+
+def render_health(
+    system: SystemBootstrap,
+    *,
+    limit: int = 200,
+    names: Tuple[str, ...] = ALL_STATE_EVENTS,
+) -> None:
+    # Render signature: every view below is rebuilt only on new events
+    with system_lock():
+        last_seq = system.memory.last_seq()
+        df = state_df(system, last_seq, limit, names)
+        snapshot = cached_snapshot(system, last_seq)
+
+    st.subheader("Internal Regulation")
+
+    if not df.empty:
+        st.line_chart(df[list(STATE_FIELDS)])
+    else:
+        st.info("No internal state data yet — system is stabilising.")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.subheader("Health Snapshot")
+        st.code(snapshot["health_json"], language="json")
+
+    with col2:
+        st.subheader("Phase Snapshot")
+        st.code(snapshot["phase_json"], language="json")
+
+
+def render_memory(system: SystemBootstrap, n: int = 40) -> None:
+    # One element for the whole list, not one per event
+    with system_lock():
+        text = recent_text(system, system.memory.last_seq(), n)
+    st.code(text, language=None)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import os
+import select
 import sys
-from typing import Optional
+from functools import partial
+from typing import Callable, Dict, Tuple
 
 from bootstrap.system import SystemBootstrap
+from shared.events import EventType
 
 
 # ============================================================
@@ -16,7 +20,7 @@ def print_help():
 Commands:
   w/a/s/d     -> move (manual)
   wait        -> background-only step
-  auto on     -> enable A7DO autonomy
+  auto on     -> enable A7DO autonomy (steps on its own while idle)
   auto off    -> disable A7DO autonomy
   state       -> show system snapshot
   help        -> show this help
@@ -25,6 +29,10 @@ Commands:
     )
 
 
+def _fmt(v, spec: str = ".2f") -> str:
+    return format(v, spec) if v is not None else "n/a"
+
+
 def print_step(result):
     if result.emitted_events:
         print("\n[EVENTS]")
@@ -40,16 +48,16 @@ def print_step(result):
     h = result.health
     print(
         f" events={h.event_count} "
-        f"arousal={h.arousal:.2f if h.arousal is not None else 'n/a'} "
-        f"conf={h.confidence:.2f if h.confidence is not None else 'n/a'} "
-        f"floor={h.confidence_floor:.2f if h.confidence_floor is not None else 'n/a'} "
-        f"uncert={h.uncertainty:.2f if h.uncertainty is not None else 'n/a'} "
-        f"curiosity={h.curiosity:.2f if h.curiosity is not None else 'n/a'}"
+        f"arousal={_fmt(h.arousal)} "
+        f"conf={_fmt(h.confidence)} "
+        f"floor={_fmt(h.confidence_floor)} "
+        f"uncert={_fmt(h.uncertainty)} "
+        f"curiosity={_fmt(h.curiosity)}"
     )
     print(
-        f" risks: zeno={h.zeno_risk:.2f} "
-        f"burnout={h.burnout_risk:.2f} "
-        f"stagnation={h.stagnation_risk:.2f} "
+        f" risks: zeno={_fmt(h.zeno_risk)} "
+        f"burnout={_fmt(h.burnout_risk)} "
+        f"stagnation={_fmt(h.stagnation_risk)} "
         f"notes={h.notes}"
     )
 
@@ -57,9 +65,9 @@ def print_step(result):
     p = result.phase
     print(
         f" state={p.phase_state} "
-        f"coherence={p.coherence:.2f} "
-        f"volatility={p.volatility:.2f} "
-        f"clustering={p.clustering:.2f} "
+        f"coherence={_fmt(p.coherence)} "
+        f"volatility={_fmt(p.volatility)} "
+        f"clustering={_fmt(p.clustering)} "
         f"notes={p.notes}"
     )
 
@@ -67,6 +75,108 @@ def print_step(result):
     print(" ", result.world_snapshot)
 
 
+# ============================================================
+# Commands
+# ============================================================
+
+MOVES: Dict[str, Tuple[int, int]] = {
+    "w": (0, -1),
+    "s": (0, 1),
+    "a": (-1, 0),
+    "d": (1, 0),
+}
+
+QUIT = ("quit", "exit")
+
+
+def _print_snapshot(system: SystemBootstrap) -> None:
+    snap = system.snapshot()
+    print("\n[SNAPSHOT]")
+    for k, v in snap.items():
+        print(f"{k}: {v}")
+
+
+def _set_autonomy(system: SystemBootstrap, enabled: bool) -> None:
+    system.enable_autonomy = enabled
+    print("Autonomy enabled." if enabled else "Autonomy disabled.")
+
+
+COMMANDS: Dict[str, Callable[[SystemBootstrap], None]] = {
+    "help": lambda system: print_help(),
+    "state": _print_snapshot,
+    "wait": lambda system: print_step(system.step()),
+    "auto on": partial(_set_autonomy, enabled=True),
+    "auto off": partial(_set_autonomy, enabled=False),
+}
+
+
+# ============================================================
+# Input
+# ============================================================
+
+# Seconds of idle stdin between autonomous steps
+AUTONOMY_TICK = 0.5
+
+# select() only works on stdin for POSIX file descriptors
+_CAN_POLL_STDIN = os.name == "posix"
+
+# Bytes read from the stdin fd but not yet returned as a line. stdin is
+# read with os.read only, so select() never misses data held in a
+# Python-level buffer.
+_stdin_buf = bytearray()
+
+
+def _take_line() -> str:
+    """
+    Next complete line from _stdin_buf, or "" if none is buffered.
+    """
+    end = _stdin_buf.find(b"\n")
+    if end < 0:
+        return ""
+    line = bytes(_stdin_buf[: end + 1])
+    del _stdin_buf[: end + 1]
+    return line.decode(errors="replace")
+
+
+def read_command(system: SystemBootstrap) -> str:
+    """
+    Next input line.
+
+    With autonomy on, stdin is polled and the system steps on its own
+    every AUTONOMY_TICK seconds until a line arrives; steps in which
+    A7DO acted are printed. Off POSIX this blocks in input(). Raises
+    EOFError at end of input, like input().
+    """
+    if not _CAN_POLL_STDIN:
+        return input("\n> ")
+
+    print("\n> ", end="", flush=True)
+    fd = sys.stdin.fileno()
+    while True:
+        line = _take_line()
+        if line:
+            return line
+
+        if system.enable_autonomy:
+            ready, _, _ = select.select([fd], [], [], AUTONOMY_TICK)
+            if not ready:
+                result = system.step()
+                if any(e.type is EventType.ACTION for e in result.emitted_events):
+                    print_step(result)
+                    print("\n> ", end="", flush=True)
+                continue
+
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            if not _stdin_buf:
+                raise EOFError
+            # Last line without a trailing newline
+            line = _stdin_buf.decode(errors="replace")
+            _stdin_buf.clear()
+            return line
+        _stdin_buf.extend(chunk)
+
+
 # ============================================================
 # Main Runner
 # ============================================================
@@ -80,7 +190,7 @@ def main():
     try:
         while True:
             try:
-                cmd = input("\n> ").strip().lower()
+                cmd = read_command(system).strip().lower()
             except (EOFError, KeyboardInterrupt):
                 print("\nExiting.")
                 break
@@ -88,48 +198,17 @@ def main():
             if not cmd:
                 continue
 
-            if cmd in ("quit", "exit"):
+            if cmd in QUIT:
                 break
 
-            if cmd == "help":
-                print_help()
-                continue
-
-            if cmd == "state":
-                snap = system.snapshot()
-                print("\n[SNAPSHOT]")
-                for k, v in snap.items():
-                    print(f"{k}: {v}")
-                continue
-
-            if cmd == "wait":
-                result = system.step()
-                print_step(result)
-                continue
-
-            if cmd == "auto on":
-                system.enable_autonomy = True
-                print("Autonomy enabled.")
-                continue
-
-            if cmd == "auto off":
-                system.enable_autonomy = False
-                print("Autonomy disabled.")
+            handler = COMMANDS.get(cmd)
+            if handler is not None:
+                handler(system)
                 continue
 
-            if cmd in ("w", "a", "s", "d"):
-                dx, dy = 0, 0
-                if cmd == "w":
-                    dy = -1
-                elif cmd == "s":
-                    dy = 1
-                elif cmd == "a":
-                    dx = -1
-                elif cmd == "d":
-                    dx = 1
-
-                result = system.apply_move(dx, dy)
-                print_step(result)
+            move = MOVES.get(cmd)
+            if move is not None:
+                print_step(system.apply_move(*move))
                 continue
 
             # Any other text becomes a raw user observation
@@ -18,12 +18,17 @@ if str(PROJECT_ROOT) not in sys.path:
 # ------------------------------------------------------------
 
 import streamlit as st
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
 
+from apps._common import (
+    autonomy_checkbox,
+    move_system,
+    render_health,
+    render_memory,
+    render_world,
+    session_system,
+    step_system,
+)
 from bootstrap.system import SystemBootstrap
-from shared.events import EventType
 
 
 # ============================================================
@@ -37,14 +42,7 @@ st.set_page_config(
 
 st.title("A7DO — Living Cognitive System")
 
-# ------------------------------------------------------------
-# Session state
-# ------------------------------------------------------------
-
-if "system" not in st.session_state:
-    st.session_state.system = SystemBootstrap(enable_autonomy=False)
-
-system: SystemBootstrap = st.session_state.system
+system: SystemBootstrap = session_system(autonomy_default=False)
 
 
 # ============================================================
@@ -53,138 +51,63 @@ system: SystemBootstrap = st.session_state.system
 
 st.sidebar.header("Controls")
 
-system.enable_autonomy = st.sidebar.checkbox(
-    "Enable Autonomy",
-    value=system.enable_autonomy,
-)
+autonomy_checkbox()
 
+# No shutdown control: the system is shared by every session and is
+# closed at process exit
 if st.sidebar.button("Background Step"):
-    system.step()
-
-if st.sidebar.button("Shutdown System"):
-    system.close()
-    st.stop()
+    step_system(system)
 
 
 # ============================================================
 # Tabs
 # ============================================================
+# Each tab body is a fragment: a button inside it reruns only that
+# tab, not its siblings. Sidebar controls still rerun the whole page.
 
 tab_world, tab_health, tab_memory = st.tabs(
     ["🌍 World", "📈 Health & Phase", "🧠 Memory"]
 )
 
-# ============================================================
-# 🌍 WORLD TAB
-# ============================================================
 
-with tab_world:
+@st.fragment
+def _world_tab(system: SystemBootstrap) -> None:
     st.subheader("World")
 
     col_left, col_mid, col_right = st.columns([1, 2, 1])
 
     with col_left:
         if st.button("⬆️"):
-            system.apply_move(0, -1)
+            move_system(system, 0, -1)
         if st.button("⬇️"):
-            system.apply_move(0, 1)
+            move_system(system, 0, 1)
 
     with col_right:
         if st.button("⬅️"):
-            system.apply_move(-1, 0)
+            move_system(system, -1, 0)
         if st.button("➡️"):
-            system.apply_move(1, 0)
+            move_system(system, 1, 0)
 
-    world = system.world.snapshot()
-    size_x, size_y = world["size"]
-    agent = world.get("agent")
+    with col_mid:
+        render_world(system)
 
-    grid = np.zeros((size_y, size_x))
-    if agent:
-        x, y = agent
-        grid[y, x] = 1.0
 
-    fig, ax = plt.subplots(figsize=(4, 4))
-    ax.imshow(grid, origin="upper")
-    ax.set_xticks(range(size_x))
-    ax.set_yticks(range(size_y))
-    ax.grid(True)
-    ax.set_xticklabels([])
-    ax.set_yticklabels([])
-    st.pyplot(fig)
+@st.fragment
+def _health_tab(system: SystemBootstrap) -> None:
+    render_health(system)
 
 
-# ============================================================
-# 📈 HEALTH & PHASE TAB
-# ============================================================
+@st.fragment
+def _memory_tab(system: SystemBootstrap) -> None:
+    st.subheader("Recent Memory Events")
+    render_memory(system, 40)
 
-with tab_health:
-    st.subheader("Internal Regulation")
-
-    # Pull recent memory
-    recent_events = system.memory.recent(300)
-
-    # --------------------------------------------------------
-    # Build dataframe from INTERNAL events
-    # --------------------------------------------------------
-
-    rows = []
-    for e in recent_events:
-        if (
-            e.type == EventType.INTERNAL
-            and e.name in ("state_update", "light_tick")
-        ):
-            state = e.payload.get("state", {})
-            rows.append(
-                {
-                    "arousal": state.get("arousal"),
-                    "confidence": state.get("confidence"),
-                    "confidence_floor": state.get("confidence_floor"),
-                    "uncertainty": state.get("uncertainty"),
-                    "curiosity": state.get("curiosity"),
-                }
-            )
-
-    df = pd.DataFrame(rows)
-
-    if not df.empty:
-        st.line_chart(
-            df[
-                [
-                    "arousal",
-                    "confidence",
-                    "confidence_floor",
-                    "uncertainty",
-                    "curiosity",
-                ]
-            ]
-        )
-    else:
-        st.info("No internal state data yet — system is stabilising.")
-
-    # --------------------------------------------------------
-    # Health + Phase snapshots
-    # --------------------------------------------------------
-
-    snapshot = system.snapshot()
-
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.subheader("Health Snapshot")
-        st.json(snapshot["health"])
-
-    with col2:
-        st.subheader("Phase Snapshot")
-        st.json(snapshot["phase"])
 
+with tab_world:
+    _world_tab(system)
 
-# ============================================================
-# 🧠 MEMORY TAB
-# ============================================================
+with tab_health:
+    _health_tab(system)
 
 with tab_memory:
-    st.subheader("Recent Memory Events")
-
-    for e in system.memory.recent(40):
-        st.text(e.summary())
+    _memory_tab(system)
@@ -1,8 +1,20 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
 import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
 
-from bootstrap.system import SystemBootstrap
+from apps._common import (
+    autonomy_checkbox,
+    move_system,
+    render_memory,
+    render_world,
+    session_system,
+    step_system,
+)
 
 
 # ============================================================
@@ -12,10 +24,7 @@ from bootstrap.system import SystemBootstrap
 st.set_page_config(page_title="A7DO — World", layout="wide")
 st.title("A7DO — Visual World")
 
-if "system" not in st.session_state:
-    st.session_state.system = SystemBootstrap(enable_autonomy=False)
-
-system = st.session_state.system
+system = session_system(autonomy_default=False)
 
 
 # ============================================================
@@ -26,20 +35,17 @@ st.sidebar.header("Controls")
 
 col1, col2, col3 = st.sidebar.columns(3)
 if col2.button("⬆️"):
-    result = system.apply_move(0, -1)
+    move_system(system, 0, -1)
 elif col1.button("⬅️"):
-    result = system.apply_move(-1, 0)
+    move_system(system, -1, 0)
 elif col3.button("➡️"):
-    result = system.apply_move(1, 0)
+    move_system(system, 1, 0)
 elif st.sidebar.button("⬇️"):
-    result = system.apply_move(0, 1)
+    move_system(system, 0, 1)
 elif st.sidebar.button("Wait"):
-    result = system.step()
-else:
-    result = None
+    step_system(system)
 
-auto = st.sidebar.checkbox("Enable Autonomy", value=system.enable_autonomy)
-system.enable_autonomy = auto
+autonomy_checkbox()
 
 
 # ============================================================
@@ -47,26 +53,7 @@ system.enable_autonomy = auto
 # ============================================================
 
 st.subheader("World State")
-
-world = system.world.snapshot()
-size_x, size_y = world["size"]
-agent_pos = world["agent"]
-
-grid = np.zeros((size_y, size_x))
-
-if agent_pos:
-    ax, ay = agent_pos
-    grid[ay, ax] = 1.0
-
-fig, ax = plt.subplots(figsize=(4, 4))
-ax.imshow(grid, origin="upper")
-ax.set_xticks(range(size_x))
-ax.set_yticks(range(size_y))
-ax.set_xticklabels([])
-ax.set_yticklabels([])
-ax.grid(True)
-
-st.pyplot(fig)
+render_world(system)
 
 
 # ============================================================
@@ -74,6 +61,4 @@ st.pyplot(fig)
 # ============================================================
 
 st.subheader("Recent Events")
-recent = system.memory.recent(10)
-for e in recent:
-    st.text(e.summary())
+render_memory(system, 10)
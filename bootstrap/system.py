@@ -16,7 +16,7 @@ if str(PROJECT_ROOT) not in sys.path:
 # Imports
 # ------------------------------------------------------------
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
 from a7do.background_core.core import BackgroundCore
@@ -28,7 +28,7 @@ from a7do.cognition.prediction import PredictionEngine
 from a7do.cognition.boundary import BoundaryDetector
 
 from shared.events import Event, action, observation, system_event
-from shared.memory import MemoryStore
+from shared.memory import MemoryStore, TYPE_WINDOW
 from shared.health import HealthAnalyzer, HealthSnapshot
 
 from world.world import World
@@ -39,7 +39,7 @@ from sled.phase.core import PhaseAnalyzer, PhaseSnapshot
 # Bootstrap Output Bundle
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepResult:
     emitted_events: List[Event]
     percepts: List[Percept]
@@ -100,8 +100,13 @@ class SystemBootstrap:
         self.health = HealthAnalyzer()
         self.phase = PhaseAnalyzer()
 
+        # (memory.version, health, phase) of the most recent analysis
+        self._analysis: Optional[Tuple[int, HealthSnapshot, PhaseSnapshot]] = None
+        # (health, health dict, phase dict) last served by snapshot()
+        self._snapshot_dicts: Optional[Tuple[HealthSnapshot, Dict[str, Any], Dict[str, Any]]] = None
+
         self.predictor = PredictionEngine()
-        self.boundary = BoundaryDetector()
+        self.boundary = BoundaryDetector(width=self.world.width, height=self.world.height)
 
         # ----------------------------
         # Agent
@@ -139,6 +144,7 @@ class SystemBootstrap:
             self.memory.__exit__(None, None, None)
         except Exception:
             pass
+        self.identity_store.close()
 
     # --------------------------------------------------------
     # External control (movement)
@@ -147,30 +153,14 @@ class SystemBootstrap:
     def apply_move(self, dx: int, dy: int, source: str = "user") -> StepResult:
         emitted: List[Event] = []
 
-        # Action
-        act = action(source=source, name="move", payload={"dx": dx, "dy": dy})
-        self.memory.append(act)
-        emitted.append(act)
-
-        # World step
-        world_events = self.world.step(act)
-        self.memory.append_many(world_events)
-        emitted.extend(world_events)
+        # One commit for the whole step
+        with self.memory.transaction():
+            # Action + world + prediction + boundary
+            act = action(source=source, name="move", payload={"dx": dx, "dy": dy})
+            self._resolve_action(act, emitted)
 
-        # Prediction error (expectation vs outcome)
-        pred_events = self.predictor.observe(emitted)
-        if pred_events:
-            self.memory.append_many(pred_events)
-            emitted.extend(pred_events)
-
-        # Boundary detection (continuous resistance)
-        boundary_events = self.boundary.observe(emitted)
-        if boundary_events:
-            self.memory.append_many(boundary_events)
-            emitted.extend(boundary_events)
-
-        # Background regulation AFTER experience is resolved
-        emitted.extend(self.bg.step())
+            # Background regulation AFTER experience is resolved
+            self.bg.step(emitted)
 
         # Agent observes outcomes (no mutation)
         self.agent.observe_outcomes()
@@ -182,69 +172,124 @@ class SystemBootstrap:
     # System tick
     # --------------------------------------------------------
 
-    def step(self, user_text: Optional[str] = None) -> StepResult:
+    def step(
+        self,
+        user_text: Optional[str] = None,
+        *,
+        autonomy: Optional[bool] = None,
+    ) -> StepResult:
+        """
+        One tick. autonomy overrides enable_autonomy for this call only.
+        """
+        if autonomy is None:
+            autonomy = self.enable_autonomy
         emitted: List[Event] = []
 
-        # Optional user utterance
-        if user_text:
-            e = observation(
-                source="user",
-                name="utterance",
-                payload={"text": str(user_text)},
-            )
-            self.memory.append(e)
-            emitted.append(e)
+        # One commit for the whole step
+        with self.memory.transaction():
+            # Optional user utterance
+            if user_text:
+                e = observation(
+                    source="user",
+                    name="utterance",
+                    payload={"text": str(user_text)},
+                )
+                self.memory.append(e)
+                emitted.append(e)
+
+            # Background regulation
+            self.bg.step(emitted)
+            self.agent.observe_outcomes()
+
+            # Optional autonomy
+            if autonomy:
+                act = self.agent.decide()
+                if act:
+                    self._resolve_action(act, emitted)
+
+                    # Regulation after autonomy
+                    self.bg.step(emitted)
 
-        # Background regulation
-        emitted.extend(self.bg.step())
-        self.agent.observe_outcomes()
+        percepts = self.perception.process(emitted)
+        return self._bundle(emitted, percepts)
 
-        # Optional autonomy
-        if self.enable_autonomy:
-            act = self.agent.decide()
-            if act:
-                self.memory.append(act)
-                emitted.append(act)
+    # --------------------------------------------------------
+    # Experience resolution
+    # --------------------------------------------------------
 
-                world_events = self.world.step(act)
-                self.memory.append_many(world_events)
-                emitted.extend(world_events)
+    def _resolve_action(self, act: Event, emitted: List[Event]) -> None:
+        """
+        Resolve one action through world, prediction and boundary.
 
-                # Prediction error
-                pred_events = self.predictor.observe(emitted)
-                if pred_events:
-                    self.memory.append_many(pred_events)
-                    emitted.extend(pred_events)
+        The action and everything it causes are appended to memory as
+        one batch, before regulation and the agent read memory again.
+        Callers wrap the step in memory.transaction(), so the batch is
+        committed together with the rest of the step.
 
-                # Boundary detection
-                boundary_events = self.boundary.observe(emitted)
-                if boundary_events:
-                    self.memory.append_many(boundary_events)
-                    emitted.extend(boundary_events)
+        Every stage appends straight into `emitted` (the step's one
+        result list), so no per-stage lists are built.
+        """
+        start = len(emitted)
+        emitted.append(act)
 
-                # Regulation after autonomy
-                emitted.extend(self.bg.step())
+        # World step
+        self.world.step(act, emitted)
 
-        percepts = self.perception.process(emitted)
-        return self._bundle(emitted, percepts)
+        # Prediction error (expectation vs outcome)
+        self.predictor.observe(emitted, emitted)
+
+        # Boundary detection (continuous resistance)
+        self.boundary.observe(emitted, emitted)
+
+        self.memory.append_many(emitted[start:])
 
     # --------------------------------------------------------
     # Bundling
     # --------------------------------------------------------
 
+    def _analyze(self) -> Tuple[HealthSnapshot, PhaseSnapshot]:
+        """
+        Health and phase over recent memory, recomputed only when memory
+        has grown since the last call (memory is append-only). Keyed on
+        memory.version, so a cache hit costs no query.
+        """
+        version = self.memory.version
+        cached = self._analysis
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+
+        # The store's rolling type histogram covers exactly this window
+        recent = self.memory.recent(TYPE_WINDOW)
+        counts = self.memory.recent_type_histogram()
+        health = self.health.analyze(recent, counts, self.memory.recent_state_event())
+        phase = self.phase.analyze(recent, counts, self.memory.recent_type_codes())
+        self._analysis = (version, health, phase)
+        return health, phase
+
     def _bundle(self, emitted: List[Event], percepts: List[Percept]) -> StepResult:
-        recent = self.memory.recent(300)
+        health, phase = self._analyze()
         return StepResult(
             emitted_events=emitted,
             percepts=percepts,
-            health=self.health.analyze(recent),
-            phase=self.phase.analyze(recent),
+            health=health,
+            phase=phase,
             identity=self.identity,
             world_snapshot=self.world.snapshot(),
         )
 
     def snapshot(self) -> Dict[str, Any]:
-        recent = self.memory.recent(300)
+        """
+        Debug / UI view of the system.
+
+        The health and phase dicts are converted once per analysis and
+        shared between calls; treat them as read-only.
+        """
+        health, phase = self._analyze()
+        dicts = self._snapshot_dicts
+        if dicts is None or dicts[0] is not health:
+            dicts = (health, asdict(health), asdict(phase))
+            self._snapshot_dicts = dicts
+
         return {
             "identity": {
                 "identity_id": self.identity.identity_id,
@@ -253,6 +298,6 @@ class SystemBootstrap:
                 "continuity_version": self.identity.continuity_version,
             },
             "world": self.world.snapshot(),
-            "health": self.health.analyze(recent).__dict__,
-            "phase": self.phase.analyze(recent).__dict__,
+            "health": dicts[1],
+            "phase": dicts[2],
         }
\ No newline at end of file
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import itertools
+import os
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, Optional
@@ -24,11 +27,44 @@ class EventType(str, Enum):
     SYSTEM = "system"             # Startup, shutdown, warnings
 
 
+# Small-int code per type (declaration order), for numpy type arrays
+EVENT_TYPES = tuple(EventType)
+TYPE_CODE: Dict[EventType, int] = {t: i for i, t in enumerate(EVENT_TYPES)}
+
+# Stored value -> member: a dict hit instead of EventType(value) per row
+TYPE_BY_VALUE: Dict[str, EventType] = {t.value: t for t in EVENT_TYPES}
+
+
+# ============================================================
+# Event Ids
+# ============================================================
+# A random per-process prefix (64 bits) plus a counter: unique across
+# processes and restarts without a urandom read per event.
+
+_ID_PREFIX = ""
+_ID_COUNTER = itertools.count(1)
+
+
+def _reset_ids() -> None:
+    global _ID_PREFIX, _ID_COUNTER
+    _ID_PREFIX = uuid4().hex[:16] + "-"
+    _ID_COUNTER = itertools.count(1)
+
+
+_reset_ids()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_ids)
+
+
+def new_event_id() -> str:
+    return _ID_PREFIX + format(next(_ID_COUNTER), "x")
+
+
 # ============================================================
 # Base Event
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Event:
     """
     Canonical event object shared across the entire system.
@@ -42,15 +78,35 @@ class Event:
     name: str                     # short semantic label (e.g. "touch", "move")
     payload: Dict[str, Any]       # event-specific data
 
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=new_event_id)
     parent_id: Optional[str] = None   # causal linkage
     confidence: Optional[float] = None  # optional belief strength (0–1)
 
+    # Derived: OUTCOME success flag (payload["ok"] when it is a bool)
+    ok: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+
+    # Cached by summary(); every field it reads is immutable
+    _summary: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Interned so == on names usually hits the identity fast path
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "source", sys.intern(self.source))
+
+        if self.type is EventType.OUTCOME and self.payload:
+            ok = self.payload.get("ok")
+            if ok is True or ok is False:
+                object.__setattr__(self, "ok", ok)
+
     def summary(self) -> str:
         """
         Human-readable one-line summary for logging / debugging.
         """
-        return f"[{self.type}] {self.source}:{self.name} ({self.id})"
+        s = self._summary
+        if s is None:
+            s = f"[{self.type}] {self.source}:{self.name} ({self.id})"
+            object.__setattr__(self, "_summary", s)
+        return s
 
 
 # ============================================================
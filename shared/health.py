@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
 from shared.events import Event, EventType
 
+# Event types compare by identity; names by ==
+_INTERNAL = EventType.INTERNAL
+_OBSERVATION = EventType.OBSERVATION
+_ACTION = EventType.ACTION
+_STATE_NAMES = (sys.intern("state_update"), sys.intern("light_tick"))
+
+# analyze(latest_state=...) default: find it in the window
+_SCAN: Any = object()
+
 
 # ============================================================
 # Health Signals (Computed, Not Stored)
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HealthSnapshot:
     """
     Advisory snapshot of system stability.
@@ -59,12 +69,51 @@ class HealthAnalyzer:
     # Public API
     # ----------------------------
 
-    def analyze(self, events: Iterable[Event]) -> HealthSnapshot:
-        events_list = list(events)
+    def analyze(
+        self,
+        events: Iterable[Event],
+        type_counts: Optional[Mapping[EventType, int]] = None,
+        latest_state: Optional[Event] = _SCAN,
+    ) -> HealthSnapshot:
+        """
+        Optional precomputed inputs (e.g. from MemoryStore), so the
+        window is not rescanned:
+        - type_counts: per-type counts of `events`
+        - latest_state: newest state event in `events`, or None
+        """
+        # Read-only here, so a list (e.g. memory.recent) is used as is
+        events_list = events if isinstance(events, list) else list(events)
         n = len(events_list)
 
+        last_state: Optional[Event] = None
+        if type_counts is None:
+            # One pass: type counts + the latest internal state event
+            internal_count = obs_count = act_count = 0
+            for e in events_list:
+                t = e.type
+                if t is _INTERNAL:
+                    internal_count += 1
+                    if e.name in _STATE_NAMES:
+                        last_state = e
+                elif t is _OBSERVATION:
+                    obs_count += 1
+                elif t is _ACTION:
+                    act_count += 1
+        else:
+            internal_count = type_counts.get(_INTERNAL, 0)
+            obs_count = type_counts.get(_OBSERVATION, 0)
+            act_count = type_counts.get(_ACTION, 0)
+            if latest_state is _SCAN:
+                for e in reversed(events_list):
+                    if e.type is _INTERNAL and e.name in _STATE_NAMES:
+                        last_state = e
+                        break
+
+        if latest_state is not _SCAN:
+            last_state = latest_state
+
         # Extract last known internal state
-        internal_state = self._latest_internal_state(events_list)
+        internal_state = self._latest_internal_state(last_state)
 
         arousal = internal_state.get("arousal")
         confidence = internal_state.get("confidence")
@@ -73,9 +122,9 @@ class HealthAnalyzer:
         curiosity = internal_state.get("curiosity")
 
         # Compute risks
-        zeno = self._compute_zeno_risk(events_list, arousal, confidence)
+        zeno = self._compute_zeno_risk(n, internal_count, arousal, confidence)
         burnout = self._compute_burnout_risk(arousal, confidence, confidence_floor)
-        stagnation = self._compute_stagnation_risk(events_list, curiosity)
+        stagnation = self._compute_stagnation_risk(obs_count + act_count, curiosity)
 
         notes: List[str] = []
         if zeno > 0.7:
@@ -102,24 +151,23 @@ class HealthAnalyzer:
     # Internal helpers
     # ----------------------------
 
-    def _latest_internal_state(self, events: List[Event]) -> Dict[str, Optional[float]]:
+    def _latest_internal_state(self, e: Optional[Event]) -> Dict[str, Optional[float]]:
         """
-        Finds the most recent Background Core internal state.
+        State carried by the most recent Background Core internal event.
 
         Accepts:
         - full cycles  → state_update
         - light ticks  → light_tick
         """
-        for e in reversed(events):
-            if e.type == EventType.INTERNAL and e.name in ("state_update", "light_tick"):
-                state = e.payload.get("state", {})
-                return {
-                    "arousal": state.get("arousal"),
-                    "confidence": state.get("confidence"),
-                    "confidence_floor": state.get("confidence_floor"),
-                    "uncertainty": state.get("uncertainty"),
-                    "curiosity": state.get("curiosity"),
-                }
+        if e is not None:
+            state = e.payload.get("state", {})
+            return {
+                "arousal": state.get("arousal"),
+                "confidence": state.get("confidence"),
+                "confidence_floor": state.get("confidence_floor"),
+                "uncertainty": state.get("uncertainty"),
+                "curiosity": state.get("curiosity"),
+            }
 
         return {
             "arousal": None,
@@ -131,7 +179,8 @@ class HealthAnalyzer:
 
     def _compute_zeno_risk(
         self,
-        events: List[Event],
+        event_count: int,
+        internal_count: int,
         arousal: Optional[float],
         confidence: Optional[float],
     ) -> float:
@@ -141,18 +190,13 @@ class HealthAnalyzer:
         if arousal is None or confidence is None:
             return 0.0
 
-        internal_events = [e for e in events if e.type == EventType.INTERNAL]
-
-        if len(internal_events) < 5:
+        if internal_count < 5:
             return 0.0
 
-        density = min(1.0, len(internal_events) / max(1, len(events)))
-        risk = 0.0
-
-        if arousal > 0.8 and confidence < 0.25:
-            risk += 0.5
+        density = min(1.0, internal_count / max(1, event_count))
 
-        risk += 0.5 * density
+        # Thresholds as 0/1 factors (bool arithmetic, no branches)
+        risk = 0.5 * ((arousal > 0.8) & (confidence < 0.25)) + 0.5 * density
         return min(1.0, risk)
 
     def _compute_burnout_risk(
@@ -167,34 +211,25 @@ class HealthAnalyzer:
         if arousal is None or confidence is None or confidence_floor is None:
             return 0.0
 
-        risk = 0.0
-
-        if arousal > 0.85:
-            risk += 0.4
-
-        if confidence < confidence_floor + 0.05:
-            risk += 0.4
-
-        if arousal > 0.9 and confidence < 0.2:
-            risk += 0.2
-
+        # Thresholds as 0/1 factors (bool arithmetic, no branches)
+        risk = (
+            0.4 * (arousal > 0.85)
+            + 0.4 * (confidence < confidence_floor + 0.05)
+            + 0.2 * ((arousal > 0.9) & (confidence < 0.2))
+        )
         return min(1.0, risk)
 
     def _compute_stagnation_risk(
         self,
-        events: List[Event],
+        experience_count: int,
         curiosity: Optional[float],
     ) -> float:
         """
         Stagnation risk: nothing happening while curiosity rises.
+
+        experience_count: observations + actions in the window.
         """
         if curiosity is None:
             return 0.0
 
-        obs_count = sum(1 for e in events if e.type == EventType.OBSERVATION)
-        act_count = sum(1 for e in events if e.type == EventType.ACTION)
-
-        if obs_count + act_count == 0 and curiosity > 0.6:
-            return min(1.0, curiosity)
-
-        return 0.0
+        return min(1.0, curiosity) * ((experience_count == 0) & (curiosity > 0.6))
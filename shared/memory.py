@@ -3,9 +3,21 @@ from __future__ import annotations
 import json
 import os
 import sqlite3
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+import sys
+import threading
+from collections import Counter, deque
+from contextlib import contextmanager
+from itertools import chain, islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from shared.events import Event, EventType
+import numpy as np
+
+from shared.events import EVENT_TYPES, TYPE_BY_VALUE, TYPE_CODE, Event, EventType
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
 
 
 # ============================================================
@@ -36,6 +48,17 @@ CREATE INDEX IF NOT EXISTS idx_events_source ON events(source);
 CREATE INDEX IF NOT EXISTS idx_events_name ON events(name);
 """
 
+# Per-connection tuning for an append-heavy log. With WAL,
+# synchronous=NORMAL syncs only at checkpoints: a power loss can drop
+# the last commits but never corrupts the database.
+PRAGMAS_SQL = """
+PRAGMA synchronous=NORMAL;
+PRAGMA cache_size=-65536;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA wal_autocheckpoint=1000;
+"""
+
 
 # ============================================================
 # Exceptions
@@ -59,29 +82,81 @@ def _ensure_dir(path: str) -> None:
         os.makedirs(d, exist_ok=True)
 
 
-def _event_to_row(e: Event) -> Dict[str, Any]:
+# Positional parameters in _event_to_row order
+_INSERT_HEAD = (
+    "INSERT INTO events (id, parent_id, type, source, name, payload_json, confidence) "
+    "VALUES "
+)
+_ROW_MARKS = "(?, ?, ?, ?, ?, ?, ?)"
+
+# Rows per multi-row INSERT (7 params each, under SQLite's 999 limit)
+INSERT_CHUNK = 100
+
+_insert_sql_cache: Dict[int, str] = {}
+
+_SELECT_BY_ID_SQL = "SELECT * FROM events WHERE id = ? LIMIT 1"
+
+# Compiled statements kept per connection, keyed by SQL text. Room for
+# every multi-row INSERT size plus the read queries.
+STATEMENT_CACHE_SIZE = 256
+
+
+def _insert_sql(n: int) -> str:
+    sql = _insert_sql_cache.get(n)
+    if sql is None:
+        sql = _insert_sql_cache[n] = _INSERT_HEAD + ", ".join([_ROW_MARKS] * n)
+    return sql
+
+
+def _insert_rows(conn: sqlite3.Connection, rows: List[Tuple[Any, ...]]) -> None:
+    """
+    Insert rows with multi-row VALUES statements of up to INSERT_CHUNK
+    rows: one statement step per chunk instead of one per row.
+    """
+    for i in range(0, len(rows), INSERT_CHUNK):
+        chunk = rows[i:i + INSERT_CHUNK]
+        conn.execute(_insert_sql(len(chunk)), list(chain.from_iterable(chunk)))
+
+
+# Payload codec. orjson output matches the compact stdlib form, except
+# that NaN/Infinity become null instead of non-standard JSON tokens.
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _dumps_payload(payload: Dict[str, Any]) -> str:
+        return orjson.dumps(payload, option=_ORJSON_OPTIONS).decode("utf-8")
+
+    _loads_payload = orjson.loads
+else:
+    def _dumps_payload(payload: Dict[str, Any]) -> str:
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+    _loads_payload = json.loads
+
+
+def _event_to_row(e: Event) -> Tuple[Any, ...]:
     try:
-        payload_json = json.dumps(e.payload, ensure_ascii=False, separators=(",", ":"))
-    except TypeError as ex:
+        payload_json = _dumps_payload(e.payload)
+    except TypeError as ex:  # orjson.JSONEncodeError subclasses TypeError
         raise MemoryError(
             f"Event payload is not JSON serializable for event {e.id} ({e.name})."
         ) from ex
 
-    return {
-        "id": e.id,
-        "parent_id": e.parent_id,
-        "type": e.type.value if isinstance(e.type, EventType) else str(e.type),
-        "source": e.source,
-        "name": e.name,
-        "payload_json": payload_json,
-        "confidence": e.confidence,
-    }
+    return (
+        e.id,
+        e.parent_id,
+        e.type.value,
+        e.source,
+        e.name,
+        payload_json,
+        e.confidence,
+    )
 
 
 def _row_to_event(row: sqlite3.Row) -> Event:
-    payload = json.loads(row["payload_json"]) if row["payload_json"] else {}
+    payload = _loads_payload(row["payload_json"]) if row["payload_json"] else {}
     return Event(
-        type=EventType(row["type"]),
+        type=TYPE_BY_VALUE[row["type"]],
         source=row["source"],
         name=row["name"],
         payload=payload,
@@ -91,6 +166,36 @@ def _row_to_event(row: sqlite3.Row) -> Event:
     )
 
 
+# Background Core state fields returned by MemoryStore.recent_states
+STATE_FIELDS = (
+    "arousal",
+    "confidence",
+    "confidence_floor",
+    "uncertainty",
+    "curiosity",
+)
+
+# Internal events that carry a Background Core state snapshot
+STATE_EVENT_NAMES = (sys.intern("state_update"), sys.intern("light_tick"))
+
+_STATE_COLUMNS_SQL = ", ".join(
+    f"json_extract(payload_json, '$.state.{f}')" for f in STATE_FIELDS
+)
+
+
+# Events kept in memory to serve MemoryStore.recent without SQLite
+RECENT_RING_SIZE = 512
+
+# Distinct recent(n) sizes memoized between writes
+_RECENT_CACHE_SIZE = 4
+
+# Events memoized by id for get() / get_with_seq()
+_ID_CACHE_SIZE = 4096
+
+# Default window of MemoryStore.recent_type_histogram
+TYPE_WINDOW = 300
+
+
 # ============================================================
 # Memory Store
 # ============================================================
@@ -103,9 +208,26 @@ class MemoryStore:
     - Append-only
     - No time dependence
     - Ordering via seq only
+
+    The newest RECENT_RING_SIZE events are mirrored in a ring that
+    `recent`, `iter_since` and `last_seq` serve from. It is primed from
+    the database on open and only sees writes made through this
+    instance.
+
+    Appends are written synchronously (seqs come from AUTOINCREMENT),
+    so integrity errors raise at the call site and the ring only ever
+    holds rows that are in the database.
+
+    The database runs in WAL mode: `<db>-wal` and `<db>-shm` files live
+    next to it and belong to it (copy all three, or close first).
     """
 
-    def __init__(self, db_path: str = "data/memory/memory.db") -> None:
+    def __init__(
+        self,
+        db_path: str = "data/memory/memory.db",
+        ring_size: int = RECENT_RING_SIZE,
+        type_window: int = TYPE_WINDOW,
+    ) -> None:
         _ensure_dir(db_path)
         self.db_path = db_path
 
@@ -115,14 +237,62 @@ class MemoryStore:
             self.db_path,
             check_same_thread=False,
             timeout=30,
+            cached_statements=STATEMENT_CACHE_SIZE,
         )
         self._conn.row_factory = sqlite3.Row
         self._init_schema()
 
+        # Appends and transaction() blocks hold _write_lock, so another
+        # thread's appends wait for an open transaction instead of
+        # joining it. Commits inside a transaction are deferred.
+        self._write_lock = threading.RLock()
+        self._tx_depth = 0
+
+        # (seq, event) for the newest events
+        self._ring: Deque[Tuple[int, Event]] = deque(maxlen=max(1, int(ring_size)))
+        # n -> recent(n) result; cleared on every write
+        self._recent_cache: Dict[int, List[Event]] = {}
+        # id -> (seq, event) found by get*; rows never change, so hits
+        # stay valid (misses are not cached: the id may be appended later)
+        self._id_cache: Dict[str, Tuple[int, Event]] = {}
+
+        # Newest `type_window` event types as int8 codes. Each code is
+        # written at i and i + window, so the window is always one
+        # contiguous slice. Alongside: a rolling type histogram and the
+        # latest state event with its position in the append order.
+        self._type_window = max(1, int(type_window))
+        self._type_codes = np.zeros(2 * self._type_window, dtype=np.int8)
+        self._type_counts: Counter = Counter()
+        self._appended = 0
+        self._last_state: Optional[Event] = None
+        self._last_state_pos = 0
+        self._version = 0
+        self._load_views()
+
     def _init_schema(self) -> None:
         self._conn.executescript(SCHEMA_SQL)
+        self._conn.executescript(PRAGMAS_SQL)
         self._conn.commit()
 
+    def _load_views(self) -> None:
+        """
+        (Re)build the ring and the rolling views from the database, on
+        open and after a rolled-back transaction.
+        """
+        self._ring.clear()
+        self._ring.extend(self._tail_from_db(self._ring.maxlen))
+        self._seq = self._ring[-1][0] if self._ring else 0
+        self._recent_cache.clear()
+        self._id_cache.clear()
+
+        self._type_codes[:] = 0
+        self._type_counts.clear()
+        self._appended = 0
+        self._last_state = None
+        self._last_state_pos = 0
+        self._track(self.recent(self._type_window))
+        self._version += 1
+
     # ----------------------------
     # Lifecycle
     # ----------------------------
@@ -139,26 +309,46 @@ class MemoryStore:
     def __exit__(self, exc_type, exc, tb) -> None:
         self.close()
 
+    # ----------------------------
+    # Transactions
+    # ----------------------------
+
+    @contextmanager
+    def transaction(self) -> Iterator["MemoryStore"]:
+        """
+        Group every append inside the block into one commit.
+
+        Rows are visible to reads on this store as soon as they are
+        appended; other connections see them at commit.
+        On error the whole block is rolled back and the ring and rolling
+        views are rebuilt from the database. Nests: only the outermost
+        block commits. Other threads' appends wait for the block to end.
+        """
+        with self._write_lock:
+            self._tx_depth += 1
+            try:
+                # Opened here: sqlite3 does not BEGIN implicitly before a
+                # SAVEPOINT, so append_many's savepoint would otherwise
+                # start the transaction and its RELEASE would commit it
+                if self._tx_depth == 1 and not self._conn.in_transaction:
+                    self._conn.execute("BEGIN")
+                yield self
+            except BaseException:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self._conn.rollback()
+                    self._load_views()
+                raise
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                self._conn.commit()
+
     # ----------------------------
     # Writes
     # ----------------------------
 
     def append(self, event: Event) -> int:
-        row = _event_to_row(event)
-        try:
-            cur = self._conn.execute(
-                """
-                INSERT INTO events (id, parent_id, type, source, name, payload_json, confidence)
-                VALUES (:id, :parent_id, :type, :source, :name, :payload_json, :confidence)
-                """,
-                row,
-            )
-            self._conn.commit()
-            return int(cur.lastrowid)
-        except sqlite3.IntegrityError as ex:
-            raise MemoryIntegrityError(
-                f"Integrity error while appending event {event.id} ({event.name})."
-            ) from ex
+        return self.append_many((event,))[1]
 
     def append_many(self, events: Iterable[Event]) -> Tuple[int, int]:
         events_list = list(events)
@@ -166,65 +356,220 @@ class MemoryStore:
             return (0, self.last_seq())
 
         rows = [_event_to_row(e) for e in events_list]
-        try:
-            self._conn.executemany(
-                """
-                INSERT INTO events (id, parent_id, type, source, name, payload_json, confidence)
-                VALUES (:id, :parent_id, :type, :source, :name, :payload_json, :confidence)
-                """,
-                rows,
-            )
-            self._conn.commit()
-        except sqlite3.IntegrityError as ex:
-            raise MemoryIntegrityError(
-                "Integrity error while appending multiple events."
-            ) from ex
-
-        return (len(events_list), self.last_seq())
+        with self._write_lock:
+            # Inside a transaction, a savepoint keeps a failed batch from
+            # leaving some of its chunks behind
+            savepoint = self._tx_depth > 0 and len(rows) > INSERT_CHUNK
+            try:
+                if savepoint:
+                    self._conn.execute("SAVEPOINT append_many")
+                _insert_rows(self._conn, rows)
+                # The write lock is held until commit, so the batch is contiguous
+                last = int(self._conn.execute("SELECT last_insert_rowid()").fetchone()[0])
+                if savepoint:
+                    self._conn.execute("RELEASE append_many")
+                if self._tx_depth == 0:
+                    self._conn.commit()
+            except sqlite3.IntegrityError as ex:
+                if savepoint:
+                    self._conn.execute("ROLLBACK TO append_many")
+                    self._conn.execute("RELEASE append_many")
+                elif self._tx_depth == 0:
+                    self._conn.rollback()
+                raise MemoryIntegrityError(
+                    f"Integrity error while appending {len(rows)} event(s) "
+                    f"starting at {events_list[0].id} ({events_list[0].name})."
+                ) from ex
+
+            first = last - len(events_list) + 1
+            self._seq = last
+            self._ring.extend(zip(range(first, last + 1), events_list))
+            self._recent_cache.clear()
+            self._track(events_list)
+            self._version += 1
+
+        return (len(events_list), last)
 
     # ----------------------------
     # Reads
     # ----------------------------
 
     def get(self, event_id: str) -> Optional[Event]:
-        cur = self._conn.execute(
-            "SELECT * FROM events WHERE id = ? LIMIT 1",
-            (event_id,),
-        )
-        row = cur.fetchone()
-        return _row_to_event(row) if row else None
+        found = self.get_with_seq(event_id)
+        return found[1] if found else None
 
     def get_with_seq(self, event_id: str) -> Optional[Tuple[int, Event]]:
+        found = self._id_cache.get(event_id)
+        if found is not None:
+            return found
+
         cur = self._conn.execute(
-            "SELECT * FROM events WHERE id = ? LIMIT 1",
+            _SELECT_BY_ID_SQL,
             (event_id,),
         )
         row = cur.fetchone()
         if not row:
             return None
-        return (int(row["seq"]), _row_to_event(row))
+
+        found = (int(row["seq"]), _row_to_event(row))
+        if len(self._id_cache) >= _ID_CACHE_SIZE:
+            self._id_cache.clear()
+        self._id_cache[event_id] = found
+        return found
 
     def last_seq(self) -> int:
-        cur = self._conn.execute("SELECT COALESCE(MAX(seq), 0) AS m FROM events")
-        return int(cur.fetchone()["m"])
+        """
+        Seq of the newest event appended through (or primed into) this
+        store; 0 when empty. Includes appends not yet committed.
+        """
+        return self._seq
 
     def recent(self, n: int = 50) -> List[Event]:
+        """
+        Newest n events, oldest first.
+
+        Calls between two writes return the same list object (shared by
+        the bootstrap analyzers and the UI); treat it as read-only.
+        """
         n = max(0, int(n))
+        cached = self._recent_cache.get(n)
+        if cached is not None:
+            return cached
+
+        ring = self._ring
+        # A ring that never filled holds every event in the store
+        if n <= len(ring) or len(ring) < ring.maxlen:
+            out = [e for _, e in islice(reversed(ring), n)]
+            out.reverse()
+        else:
+            out = [e for _, e in self._tail_from_db(n)]
+
+        if len(self._recent_cache) >= _RECENT_CACHE_SIZE:
+            self._recent_cache.clear()
+        self._recent_cache[n] = out
+        return out
+
+    def _tail_from_db(self, n: int) -> List[Tuple[int, Event]]:
         cur = self._conn.execute(
             "SELECT * FROM events ORDER BY seq DESC LIMIT ?",
             (n,),
         )
         rows = cur.fetchall()
-        return [_row_to_event(r) for r in reversed(rows)]
+        return [(int(r["seq"]), _row_to_event(r)) for r in reversed(rows)]
+
+    def _ring_since(self, seq_exclusive: int) -> Optional[List[Tuple[int, Event]]]:
+        # Every (seq, event) newer than seq_exclusive, or None when some
+        # of them have already left the ring
+        ring = self._ring
+        out: List[Tuple[int, Event]] = []
+        for pair in reversed(ring):
+            if pair[0] <= seq_exclusive:
+                break
+            out.append(pair)
+        else:
+            if len(ring) == ring.maxlen:
+                return None
+        out.reverse()
+        return out
 
     def iter_since(self, seq_exclusive: int) -> Iterable[Tuple[int, Event]]:
+        """
+        (seq, event) newer than seq_exclusive, oldest first. Served from
+        the ring while it still holds all of them.
+        """
+        seq_exclusive = int(seq_exclusive)
+        with self._write_lock:
+            tail = self._ring_since(seq_exclusive)
+        if tail is not None:
+            yield from tail
+            return
+
         cur = self._conn.execute(
             "SELECT * FROM events WHERE seq > ? ORDER BY seq ASC",
-            (int(seq_exclusive),),
+            (seq_exclusive,),
         )
         for row in cur:
             yield (int(row["seq"]), _row_to_event(row))
 
+    def recent_type_histogram(self) -> Dict[EventType, int]:
+        """
+        Event counts by type over the newest `type_window` events, kept
+        up to date on every append (no scan). Matches counting the types
+        in recent(type_window).
+        """
+        return {t: c for t, c in self._type_counts.items() if c}
+
+    @property
+    def version(self) -> int:
+        """
+        Changes on every append through this instance and whenever the
+        views are rebuilt (rollback). Matches what recent() and the
+        rolling views see.
+        """
+        return self._version
+
+    def recent_state_event(self) -> Optional[Event]:
+        """
+        Newest state_update / light_tick among the newest `type_window`
+        events, or None; tracked on append (no scan).
+        """
+        if self._appended - self._last_state_pos < self._type_window:
+            return self._last_state
+        return None
+
+    def recent_type_codes(self) -> np.ndarray:
+        """
+        Read-only view of the TYPE_CODE of the newest `type_window`
+        events, oldest first (aligned with recent(type_window)). Valid
+        until the next append.
+        """
+        w = self._type_window
+        n = self._appended
+        view = self._type_codes[n % w:n % w + w] if n >= w else self._type_codes[:n]
+        view = view.view()
+        view.flags.writeable = False
+        return view
+
+    def _track(self, events: Iterable[Event]) -> None:
+        codes = self._type_codes
+        counts = self._type_counts
+        w = self._type_window
+        for e in events:
+            t = e.type
+            i = self._appended % w
+            if self._appended >= w:
+                counts[EVENT_TYPES[codes[i]]] -= 1
+            codes[i] = codes[i + w] = TYPE_CODE[t]
+            counts[t] += 1
+            self._appended += 1
+            if t is EventType.INTERNAL and e.name in STATE_EVENT_NAMES:
+                self._last_state = e
+                self._last_state_pos = self._appended
+
+    def recent_states(
+        self,
+        limit: int = 200,
+        names: Tuple[str, ...] = STATE_EVENT_NAMES,
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Last `limit` internal state snapshots, oldest first, as tuples
+        ordered like STATE_FIELDS. Filtering and field extraction run in
+        SQLite, so no Event objects or payload dicts are built.
+        """
+        limit = max(0, int(limit))
+        marks = ", ".join("?" * len(names))
+        cur = self._conn.execute(
+            f"""
+            SELECT {_STATE_COLUMNS_SQL} FROM events
+            WHERE type = ? AND name IN ({marks})
+            ORDER BY seq DESC LIMIT ?
+            """,
+            (EventType.INTERNAL.value, *names, limit),
+        )
+        rows = cur.fetchall()
+        rows.reverse()
+        return [tuple(r) for r in rows]
+
     def find(
         self,
         *,
@@ -294,20 +639,18 @@ class MemoryStore:
 
     def verify_parent_links(self, sample_limit: int = 10000) -> Dict[str, Any]:
         sample_limit = max(1, int(sample_limit))
+        # One anti-join over the sample; each probe hits the id index
         cur = self._conn.execute(
-            "SELECT id, parent_id FROM events WHERE parent_id IS NOT NULL LIMIT ?",
+            """
+            SELECT c.id, c.parent_id FROM (
+                SELECT id, parent_id FROM events
+                WHERE parent_id IS NOT NULL LIMIT ?
+            ) AS c
+            WHERE NOT EXISTS (SELECT 1 FROM events p WHERE p.id = c.parent_id)
+            """,
             (sample_limit,),
         )
-        missing: List[Tuple[str, str]] = []
-
-        for row in cur.fetchall():
-            pid = row["parent_id"]
-            exists = self._conn.execute(
-                "SELECT 1 FROM events WHERE id = ? LIMIT 1",
-                (pid,),
-            ).fetchone()
-            if not exists:
-                missing.append((row["id"], pid))
+        missing: List[Tuple[str, str]] = [(r["id"], r["parent_id"]) for r in cur]
 
         return {"checked": sample_limit, "missing_parent_links": missing}
 
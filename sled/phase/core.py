@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
 
-from shared.events import Event, EventType
+import numpy as np
+
+from shared.events import EVENT_TYPES, TYPE_CODE, Event, EventType
+
+# Enum members are singletons; compared with `is`
+_INTERNAL = EventType.INTERNAL
+_ACTION = EventType.ACTION
+_OBSERVATION = EventType.OBSERVATION
+
+_INTERNAL_CODE = TYPE_CODE[_INTERNAL]
+_ACTION_CODE = TYPE_CODE[_ACTION]
+_OBSERVATION_CODE = TYPE_CODE[_OBSERVATION]
 
 
 # ============================================================
 # Phase Snapshot (Advisory Only)
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PhaseSnapshot:
     """
     Advisory snapshot of phase / entropy structure.
@@ -52,8 +63,21 @@ class PhaseAnalyzer:
     - Event-structure based
     """
 
-    def analyze(self, events: Iterable[Event]) -> PhaseSnapshot:
-        events_list = list(events)
+    def analyze(
+        self,
+        events: Iterable[Event],
+        type_counts: Optional[Mapping[EventType, int]] = None,
+        type_codes: Optional[np.ndarray] = None,
+    ) -> PhaseSnapshot:
+        """
+        Every measure runs in numpy over the events' TYPE_CODEs, built
+        in one pass unless given. Optional precomputed inputs (e.g.
+        from MemoryStore):
+        - type_counts: per-type counts of `events`, for the densities
+        - type_codes: TYPE_CODE of each event in order
+        """
+        # Read-only here, so a list (e.g. memory.recent) is used as is
+        events_list = events if isinstance(events, list) else list(events)
         n = len(events_list)
 
         if n == 0:
@@ -69,13 +93,24 @@ class PhaseAnalyzer:
                 notes=["no_events"],
             )
 
+        if type_codes is None:
+            type_codes = np.fromiter(
+                (TYPE_CODE[e.type] for e in events_list), dtype=np.int8, count=n
+            )
+
         # ----------------------------
         # Basic densities
         # ----------------------------
 
-        internal = sum(1 for e in events_list if e.type == EventType.INTERNAL)
-        action = sum(1 for e in events_list if e.type == EventType.ACTION)
-        observation = sum(1 for e in events_list if e.type == EventType.OBSERVATION)
+        if type_counts is None:
+            counts = np.bincount(type_codes, minlength=len(EVENT_TYPES))
+            internal = int(counts[_INTERNAL_CODE])
+            action = int(counts[_ACTION_CODE])
+            observation = int(counts[_OBSERVATION_CODE])
+        else:
+            internal = type_counts.get(_INTERNAL, 0)
+            action = type_counts.get(_ACTION, 0)
+            observation = type_counts.get(_OBSERVATION, 0)
 
         internal_density = internal / n
         action_density = action / n
@@ -85,8 +120,8 @@ class PhaseAnalyzer:
         # Structural measures
         # ----------------------------
 
-        clustering = self._compute_clustering(events_list)
-        volatility = self._compute_volatility(events_list)
+        clustering = self._compute_clustering(type_codes)
+        volatility = self._compute_volatility(type_codes)
         coherence = self._compute_coherence(internal_density, volatility)
 
         # ----------------------------
@@ -127,45 +162,33 @@ class PhaseAnalyzer:
     # Internal computations
     # ----------------------------
 
-    def _compute_clustering(self, events: List[Event]) -> float:
+    def _compute_clustering(self, codes: np.ndarray) -> float:
         """
-        Clustering: repeated INTERNAL events without intervening resolution.
+        Clustering: repeated INTERNAL events without intervening resolution
+        (counts run starts of two or more consecutive INTERNAL codes).
         """
-        if len(events) < 5:
+        n = len(codes)
+        if n < 5:
             return 0.0
 
-        internal_runs = 0
-        current_run = 0
-
-        for e in events:
-            if e.type == EventType.INTERNAL:
-                current_run += 1
-            else:
-                if current_run >= 2:
-                    internal_runs += 1
-                current_run = 0
-
-        if current_run >= 2:
-            internal_runs += 1
+        m = codes == _INTERNAL_CODE
+        starts = m[:-1] & m[1:]
+        starts[1:] &= ~m[:-2]
+        internal_runs = int(np.count_nonzero(starts))
 
-        return min(1.0, internal_runs / max(1, len(events) / 5))
+        return min(1.0, internal_runs / max(1, n / 5))
 
-    def _compute_volatility(self, events: List[Event]) -> float:
+    def _compute_volatility(self, codes: np.ndarray) -> float:
         """
-        Volatility: rapid alternation between INTERNAL and ACTION/OUTCOME.
+        Volatility: rapid alternation between event types (adjacent
+        type changes).
         """
-        if len(events) < 6:
+        n = len(codes)
+        if n < 6:
             return 0.0
 
-        flips = 0
-        last_type: Optional[EventType] = None
-
-        for e in events:
-            if last_type is not None and e.type != last_type:
-                flips += 1
-            last_type = e.type
-
-        return min(1.0, flips / max(1, len(events) - 1))
+        flips = int(np.count_nonzero(codes[1:] != codes[:-1]))
+        return min(1.0, flips / max(1, n - 1))
 
     def _compute_coherence(self, internal_density: float, volatility: float) -> float:
         """
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import pytest
+
+from shared.events import internal
+from shared.memory import INSERT_CHUNK, MemoryStore
+
+
+def _events(n: int):
+    return [internal(source="test", name="tick", payload={"i": i}) for i in range(n)]
+
+
+@pytest.mark.parametrize("n", [INSERT_CHUNK // 2, INSERT_CHUNK * 2 + 50])
+def test_transaction_rollback_discards_batch(tmp_path, n):
+    # Batches above INSERT_CHUNK go through a savepoint; the rollback
+    # must still undo them
+    with MemoryStore(str(tmp_path / "memory.db")) as m:
+        with pytest.raises(RuntimeError):
+            with m.transaction():
+                m.append_many(_events(n))
+                raise RuntimeError
+
+        assert m.last_seq() == 0
+        assert m.recent(10) == []
+        assert m._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 0
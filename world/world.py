@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 from uuid import uuid4
@@ -7,6 +8,15 @@ from uuid import uuid4
 from shared.events import Event, observation, outcome
 
 
+# Constant outcome payloads, shared by every event that carries them.
+# Events are immutable, so their payloads are treated as read-only.
+# Plain dicts (not MappingProxyType) so the JSON codecs accept them.
+_MOVE_OK: Dict[str, object] = {"ok": True}
+_OUT_OF_BOUNDS: Dict[str, object] = {"ok": False, "reason": "out_of_bounds"}
+_COLLISION: Dict[str, object] = {"ok": False, "reason": "collision"}
+_UNRECOGNIZED_ACTION: Dict[str, object] = {"ok": False, "reason": "unrecognized_action"}
+
+
 # ============================================================
 # World Primitives (No Semantics)
 # ============================================================
@@ -57,8 +67,23 @@ class World:
         self.height = int(height)
 
         self.objects: Dict[Tuple[int, int], WorldObject] = {}
+        # Row-major occupancy (index y * width + x) mirroring `objects`,
+        # so collision checks index a list instead of hashing a tuple.
+        # In-bounds cells only; objects must be placed via add_object.
+        self._cells: List[Optional[WorldObject]] = [None] * (self.width * self.height)
+        # {pos: id}, updated in place by add_object. snapshot() hands out
+        # a copy made at most once per change (None = stale), so
+        # snapshots already handed out stay as they were
+        self._object_ids: Dict[Tuple[int, int], str] = {}
+        self._object_ids_view: Optional[Dict[Tuple[int, int], str]] = {}
         self.agent: Optional[AgentBody] = None
 
+        # Object ids: one random prefix per world plus a counter, so
+        # ids stay unique across worlds and runs without a urandom read
+        # per object
+        self._object_prefix = uuid4().hex[:16] + "-obj-"
+        self._object_counter = itertools.count(1)
+
     # ----------------------------
     # Setup
     # ----------------------------
@@ -80,63 +105,74 @@ class World:
         """
         Add an object at a grid location.
         """
-        self.objects[(int(x), int(y))] = WorldObject(
-            id=str(uuid4()),
+        x, y = int(x), int(y)
+        obj = WorldObject(
+            id=self._object_prefix + format(next(self._object_counter), "x"),
             solid=bool(solid),
         )
+        self.objects[(x, y)] = obj
+        self._object_ids[(x, y)] = obj.id
+        self._object_ids_view = None
+        if self._in_bounds(x, y):
+            self._cells[y * self.width + x] = obj
 
     # ----------------------------
     # World Step
     # ----------------------------
 
-    def step(self, action_event: Event) -> List[Event]:
+    def step(self, action_event: Event, out: Optional[List[Event]] = None) -> List[Event]:
         """
         Apply an ACTION event and return resulting world events.
+        With `out`, the events are appended to it and `out` is returned.
 
         The world only understands:
         - action.name
         - action.payload
         """
+        events: List[Event] = [] if out is None else out
+
         if not self.agent:
-            return []
+            return events
 
         if action_event.name == "move":
-            return self._apply_move(action_event)
+            self._apply_move(action_event, events)
+            return events
 
         # Unknown actions are ignored but recorded as failed outcomes
-        return [
+        events.append(
             outcome(
                 source="world",
                 name="unknown_action",
-                payload={"ok": False, "reason": "unrecognized_action"},
+                payload=_UNRECOGNIZED_ACTION,
                 parent_id=action_event.id,
             )
-        ]
+        )
+        return events
 
     # ----------------------------
     # Physics
     # ----------------------------
 
-    def _apply_move(self, action_event: Event) -> List[Event]:
+    def _apply_move(self, action_event: Event, events: List[Event]) -> None:
         """
-        Attempt to move the agent by dx, dy.
+        Attempt to move the agent by dx, dy; append the results to events.
         """
         dx = int(action_event.payload.get("dx", 0))
         dy = int(action_event.payload.get("dy", 0))
 
-        target_x = self.agent.x + dx
-        target_y = self.agent.y + dy
+        agent = self.agent
+        width = self.width
+        target_x = agent.x + dx
+        target_y = agent.y + dy
 
-        events: List[Event] = []
-
-        # Boundary check
-        if not self._in_bounds(target_x, target_y):
+        # Boundary check (_in_bounds, inlined on the per-step path)
+        if not (0 <= target_x < width and 0 <= target_y < self.height):
             events.append(
                 observation(
                     source="world",
                     name="boundary_contact",
                     payload={
-                        "from": (self.agent.x, self.agent.y),
+                        "from": (agent.x, agent.y),
                         "attempt": (target_x, target_y),
                     },
                 )
@@ -145,14 +181,14 @@ class World:
                 outcome(
                     source="world",
                     name="move_blocked",
-                    payload={"ok": False, "reason": "out_of_bounds"},
+                    payload=_OUT_OF_BOUNDS,
                     parent_id=action_event.id,
                 )
             )
-            return events
+            return
 
         # Object collision
-        obj = self.objects.get((target_x, target_y))
+        obj = self._cells[target_y * width + target_x]
         if obj and obj.solid:
             events.append(
                 observation(
@@ -168,34 +204,32 @@ class World:
                 outcome(
                     source="world",
                     name="move_blocked",
-                    payload={"ok": False, "reason": "collision"},
+                    payload=_COLLISION,
                     parent_id=action_event.id,
                 )
             )
-            return events
+            return
 
         # Movement succeeds
-        self.agent.x = target_x
-        self.agent.y = target_y
+        agent.x = target_x
+        agent.y = target_y
 
         events.append(
             observation(
                 source="world",
                 name="position",
-                payload={"x": self.agent.x, "y": self.agent.y},
+                payload={"x": target_x, "y": target_y},
             )
         )
         events.append(
             outcome(
                 source="world",
                 name="move_ok",
-                payload={"ok": True},
+                payload=_MOVE_OK,
                 parent_id=action_event.id,
             )
         )
 
-        return events
-
     # ----------------------------
     # Utilities
     # ----------------------------
@@ -206,10 +240,15 @@ class World:
     def snapshot(self) -> Dict[str, object]:
         """
         Debug-only snapshot of world state.
-        Never used for cognition.
+        Never used for cognition. The objects dict is shared between
+        snapshots; treat it as read-only.
         """
+        agent = self.agent
+        objects = self._object_ids_view
+        if objects is None:
+            objects = self._object_ids_view = dict(self._object_ids)
         return {
-            "agent": None if not self.agent else (self.agent.x, self.agent.y),
-            "objects": {k: v.id for k, v in self.objects.items()},
+            "agent": None if not agent else (agent.x, agent.y),
+            "objects": objects,
             "size": (self.width, self.height),
         }